@@ -1,9 +1,16 @@
 # Standard library imports
 import os
+import re
+import pwd
 import sys
 import json
 import time
+import queue
+import bisect
+import operator
 import datetime
+import functools
+import itertools
 import threading
 import subprocess
 
@@ -19,13 +26,14 @@ from core.github_integration import GitHubManager
 from core.resource_monitor import ResourceMonitor
 from core.scheduler import setup_schedule, remove_schedule, get_schedule, get_schedule_status
 from core.system_info import get_os_info, get_cpu_info, get_memory_info, get_disk_info
-from styles import setup_styles
+from styles import setup_styles, ensure_style
 import gnupg
 
 # Export all imports
 __all__ = [
     # Standard library
-    'os', 'sys', 'json', 'time', 'datetime', 'threading', 'subprocess',
+    'os', 're', 'pwd', 'sys', 'json', 'time', 'queue', 'bisect', 'operator',
+    'datetime', 'functools', 'itertools', 'threading', 'subprocess',
     
     # Third-party
     'tk', 'ttk', 'filedialog', 'messagebox', 'keyring',
@@ -34,5 +42,5 @@ __all__ = [
     'BackupManager', 'ConfigManager', 'GitHubManager', 'ResourceMonitor',
     'setup_schedule', 'remove_schedule', 'get_schedule', 'get_schedule_status',
     'get_os_info', 'get_cpu_info', 'get_memory_info', 'get_disk_info',
-    'setup_styles', 'gnupg'
+    'setup_styles', 'ensure_style', 'gnupg'
 ] 
\ No newline at end of file
@@ -1,19 +1,64 @@
 from core.imports import *
 
+# Resolve the username once; $USER can be unset under desktop launchers
+_CURRENT_USER = pwd.getpwuid(os.getuid()).pw_name
+
+# Precomputed style names and usage-band colors for the resource monitor,
+# so the per-tick update path never formats strings
+_PROGRESSBAR_STYLES = {
+    'CPU': 'CPU.Horizontal.TProgressbar',
+    'MEM': 'MEM.Horizontal.TProgressbar',
+    'DISK': 'DISK.Horizontal.TProgressbar',
+}
+_BAND_COLORS = ("#27ae60", "#f39c12", "#e74c3c")
+
+# Number of timeline rows pushed into the Listbox per chunk; further rows
+# are appended as the user scrolls near the bottom
+_TIMELINE_CHUNK = 200
+
+# Matches searches that are a date/timestamp prefix ("2024", "2024-03",
+# "2024-03-01 12"), which can be answered by bisecting the time index
+_DATE_PREFIX_RE = re.compile(r"\d{4}(-\d{2}(-\d{2}( \d{2}(:\d{2})?)?)?)?$")
+
+# History timestamp format and its human-readable counterpart
+_TS_FMT = "%Y%m%d_%H%M"
+_TS_DISPLAY = "%Y-%m-%d %H:%M"
+
+
+def _fmt_ts(ts):
+    """Format a %Y%m%d_%H%M history timestamp for display
+
+    The format is fixed-width, so slicing avoids strptime's parse and
+    locale overhead; anything malformed falls back to the real parser
+    (and raises ValueError just like before).
+    """
+    if len(ts) == 13 and ts[8] == "_" and ts[:8].isdigit() and ts[9:].isdigit():
+        return f"{ts[:4]}-{ts[4:6]}-{ts[6:8]} {ts[9:11]}:{ts[11:13]}"
+    return datetime.datetime.strptime(ts, _TS_FMT).strftime(_TS_DISPLAY)
+
 
 def check_and_request_permissions():
-    """Check and request necessary permissions for the application"""
-    try:
-        # Check if running with sudo
-        if os.geteuid() == 0:
-            return True
+    """Check and request necessary permissions for the application
 
-        # Check if we can write to required directories
+    Returns None on success, or an error message describing the failure.
+    """
+    try:
         required_paths = [
             os.path.expanduser("~/.autostash"),
             "/var/log/autostash"
         ]
 
+        # Check if running with sudo
+        if os.geteuid() == 0:
+            # Root can create the required directories outright; later
+            # code (e.g. recording the last backup time) relies on
+            # ~/.autostash existing
+            for path in required_paths:
+                os.makedirs(path, exist_ok=True)
+            return None
+
+        # Check if we can write to required directories
+
         for path in required_paths:
             if not os.path.exists(path):
                 try:
@@ -33,49 +78,51 @@ def check_and_request_permissions():
         if not os.access(log_path, os.W_OK):
             # Request sudo access to change permissions
             result = subprocess.run(
-                ["sudo", "chown", f"{os.getenv('USER')}:", log_path],
+                ["sudo", "chown", f"{_CURRENT_USER}:", log_path],
                 capture_output=True,
                 text=True
             )
             if result.returncode != 0:
                 raise Exception(f"Failed to set permissions for: {log_path}")
 
-        # Check if we can access system directories for backup
-        system_paths = ["/etc"]
-        for path in system_paths:
-            if not os.access(path, os.R_OK):
-                # Request sudo access
-                result = subprocess.run(
-                    ["sudo", "chmod", "a+r", path],
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode != 0:
-                    raise Exception(f"Failed to set read permissions for: {path}")
-
-        return True
+        return None
 
     except Exception as e:
-        messagebox.showerror(
-            "Permission Error",
-            f"Failed to set up required permissions:\n{str(e)}\n\n"
-            "Please run the application with sudo or contact your system administrator."
-        )
-        return False
+        return str(e)
 
 class AutoStashGUI(tk.Tk):
 
     def __init__(self):
         super().__init__()
         
-        # Check permissions before initializing
-        if not check_and_request_permissions():
-            self.destroy()
-            sys.exit(1)
-            
+        # Probe permissions; on failure start in degraded mode and surface
+        # the error once the window is up instead of blocking on a modal
+        # before the main window exists
+        self._perm_error = check_and_request_permissions()
+        self._degraded = self._perm_error is not None
+
+
         self.title("AutoStash - Advanced Linux Backup System")
         self.geometry("700x1000")  # Adjusted width but kept original height
-        setup_styles(self)
+        # Keep the configured Style instance; all named styles are set up
+        # once here rather than being touched again by dialog code
+        self._style = setup_styles(self)
+
+        # Screen size, read once instead of a display-server round-trip
+        # on every dialog open; refreshed on <Configure> so centering
+        # stays right if the window moves to another monitor
+        self._screen_w = self.winfo_screenwidth()
+        self._screen_h = self.winfo_screenheight()
+        self.bind("<Configure>", self._refresh_screen_size, add="+")
+
+        # Pre-built keyword templates for the styled action buttons, so
+        # dialog construction reuses one dict per style instead of
+        # spelling the options at every call site
+        self._btn_kw = {
+            'run': {'style': 'Run.TButton'},
+            'restore': {'style': 'Restore.TButton'},
+            'options': {'style': 'Options.TButton'},
+        }
         self.minsize(700, 1000)  # Adjusted minimum width but kept original height
     
         # Initialize schedule timer
@@ -83,25 +130,74 @@ class AutoStashGUI(tk.Tk):
         self.next_backup_time = None
     
         # Configure the window
-        self.configure(bg=self.black)
+        self.configure(bg=self.palette.black)
         self.option_add("*Font", "Helvetica 11")  # Restored original font size
     
-        # Initialize resource monitor
+        # Initialize resource monitor (sampled on the Tk event loop, no thread)
         self.resource_monitor = ResourceMonitor()
+        self._resource_tick_id = None
         self.resource_monitor.register_callback(self.update_resource_display)
-        self.resource_monitor.start_monitoring(interval=2.0)
 
-    
+        # Last pushed label texts and colors, so unchanged readings skip
+        # the Tcl round-trips entirely
+        self._last_resource_strs = {}
+        self._last_resource_colors = {}
+
+        # Monitor widget handles, filled in when the monitor tab is built
+        self._resource_widgets = []
+
+
         # Initialize managers
         self.config = ConfigManager()
         self.github = GitHubManager()
         self.backup = BackupManager()
 
-        # Create data directory
-        os.makedirs(os.path.expanduser("~/.autostash"), exist_ok=True)
+        # Cached last-backup timestamp and overdue-notification marker for
+        # the hourly status check
+        self._last_backup_str = None
+        self._last_backup_dt = None
+        self._overdue_notified_for = None
+
+        # Restore dialog, built lazily once and then hidden/reshown
+        self._restore_window = None
+        self._restore_dialog_entries = []
+
+        # Details dialog, cached the same way as the restore dialog
+        self._details_window = None
+        self._details_value_labels = []
+        self._details_folders_text = None
+
+        # Mirror of the folders Listbox: a set for membership tests and an
+        # ordered list for saves, so mutations avoid O(N) Tcl snapshots
+        self._folders = set()
+        self._folders_order = []
+
+        # History file path, expanded once instead of per lookup
+        self._history_path = os.path.expanduser("~/.autostash/backup_history")
+
+        # Cached backup history entries (display text, raw line, parsed
+        # dict) plus lowercase display strings for the search filter,
+        # invalidated by file mtime
+        self._history_entries = None
+        self._history_entries_lower = None
+        self._history_cache_mtime = 0
+        self._history_time_index = []
+
+        # Last search string and its surviving (line, lower) pairs, so
+        # refinement keystrokes only re-filter the displayed subset
+        self._last_search = ""
+        self._last_filtered = []
+
+        # Parallel lists mirroring the timeline Listbox rows, so selection
+        # lookups never round-trip through Tcl string re-parsing; only the
+        # first _TIMELINE_CHUNK rows are inserted up front
+        self._timeline_raw = []
+        self._timeline_parsed = []
+        self._timeline_display = []
+        self._timeline_shown = 0
 
         # Create main container frame with some padding
-        self.main_container = tk.Frame(self, bg=self.bg_color, padx=15, pady=15)
+        self.main_container = tk.Frame(self, bg=self.palette.bg, padx=15, pady=15)
         self.main_container.pack(fill="both", expand=True)
 
         # Create and initialize header
@@ -110,50 +206,82 @@ class AutoStashGUI(tk.Tk):
         # Create widgets
         self.create_widgets()
     
-        # Load saved settings
+        # Load saved settings; the timeline is loaded when the history
+        # tab is first shown
         self.load_saved_settings()
-        self.load_backup_timeline()
         self.check_backup_status()
 
+        # Start polling system resources
+        self._poll_resources()
+
+        # In degraded mode grey out privileged options and report the
+        # failure after the window has been drawn
+        if self._degraded:
+            self.system_files_var.set(False)
+            self.system_files_check.state(['disabled'])
+            self.after(100, self._show_perm_error)
+
+    def _show_perm_error(self):
+        """Surface the startup permission failure without blocking __init__"""
+        messagebox.showerror(
+            "Permission Error",
+            f"Failed to set up required permissions:\n{self._perm_error}\n\n"
+            "Privileged options are disabled. Run the application with sudo "
+            "or contact your system administrator to enable them."
+        )
+
+    def _poll_resources(self):
+        """Sample system resources inline and reschedule on the Tk event loop"""
+        self.resource_monitor.sample()
+        self._resource_tick_id = self.after(2000, self._poll_resources)
+
+    def _refresh_screen_size(self, event=None):
+        """Update the cached screen size used to center dialogs"""
+        # <Configure> on the root also fires for every child widget
+        if event is not None and event.widget is not self:
+            return
+        self._screen_w = self.winfo_screenwidth()
+        self._screen_h = self.winfo_screenheight()
+
     def _create_header(self):
         """Create app header with logo and description"""
-        header_frame = tk.Frame(self.main_container, bg=self.bg_color)
+        header_frame = tk.Frame(self.main_container, bg=self.palette.bg)
         header_frame.pack(fill="x", pady=(0, 15))
     
         # Logo and title in the same row, centered
-        logo_title_frame = tk.Frame(header_frame, bg=self.bg_color)
+        logo_title_frame = tk.Frame(header_frame, bg=self.palette.bg)
         logo_title_frame.pack(fill="x")
     
         # Center container for logo and title
-        center_container = tk.Frame(logo_title_frame, bg=self.bg_color)
+        center_container = tk.Frame(logo_title_frame, bg=self.palette.bg)
         center_container.pack(expand=True)
     
         # Simulated logo (can be replaced with an actual image)
         logo_canvas = tk.Canvas(center_container, width=50, height=50, 
-                               bg=self.bg_color, highlightthickness=0)
+                               bg=self.palette.bg, highlightthickness=0)
         logo_canvas.pack(side="left")
     
         # Draw a backup icon
-        logo_canvas.create_oval(10, 10, 40, 40, fill=self.primary_color, outline="")
-        logo_canvas.create_rectangle(20, 5, 30, 15, fill=self.primary_color, outline="")
+        logo_canvas.create_oval(10, 10, 40, 40, fill=self.palette.primary, outline="")
+        logo_canvas.create_rectangle(20, 5, 30, 15, fill=self.palette.primary, outline="")
         logo_canvas.create_arc(15, 15, 35, 35, start=0, extent=300, 
                               style="arc", outline="white", width=2)
         logo_canvas.create_line(25, 15, 25, 25, fill="white", width=2)
         logo_canvas.create_line(25, 25, 30, 20, fill="white", width=2)
     
         # Title and subtitle
-        title_frame = tk.Frame(center_container, bg=self.bg_color)
+        title_frame = tk.Frame(center_container, bg=self.palette.bg)
         title_frame.pack(side="left", padx=10)
 
         title_label = tk.Label(title_frame, text="AutoStash", 
                               font=("Helvetica", 24, "bold"), 
-                              bg=self.bg_color, fg=self.primary_color)
+                              bg=self.palette.bg, fg=self.palette.primary)
         title_label.pack(anchor="w")
 
         subtitle_label = tk.Label(title_frame, 
                                  text="Smart Linux Backup System", 
                                  font=("Helvetica", 12), 
-                                 bg=self.bg_color, fg=self.secondary_color)
+                                 bg=self.palette.bg, fg=self.palette.secondary)
         subtitle_label.pack(anchor="w")
     
         # Divider
@@ -174,14 +302,11 @@ class AutoStashGUI(tk.Tk):
         self.notebook.add(self.monitor_tab, text="System Monitor")
         self.notebook.add(self.history_tab, text="Backup History")
 
-        # Set up the backup tab content
+        # Set up the backup tab content; monitor and history tabs stay
+        # empty until first shown to keep startup cheap
+        self._built = {'monitor': False, 'history': False}
         self._create_backup_tab()
-
-        # Set up the monitor tab content
-        self._create_monitor_tab()
-
-        # Set up the history tab content
-        self._create_history_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Create action buttons below the tabs
         self._create_action_buttons()
@@ -189,6 +314,17 @@ class AutoStashGUI(tk.Tk):
         # Create status bar at the bottom
         self._create_status_bar()
 
+    def _on_tab_changed(self, event=None):
+        """Build monitor/history tab contents on first activation"""
+        current = self.notebook.nametowidget(self.notebook.select())
+        if current is self.monitor_tab and not self._built['monitor']:
+            self._built['monitor'] = True
+            self._create_monitor_tab()
+        elif current is self.history_tab and not self._built['history']:
+            self._built['history'] = True
+            self._create_history_tab()
+            self.load_backup_timeline()
+
     def _create_backup_tab(self):
         # === Folders Frame ===
         self.folder_frame = ttk.LabelFrame(self.backup_tab, text="Backup Sources", style="Card.TLabelframe")
@@ -303,27 +439,27 @@ class AutoStashGUI(tk.Tk):
         options_grid = tk.Frame(options_inner, bg="white")
         options_grid.pack(fill="x", pady=2)
 
-        # Create option cards
+        # Create option cards: one Checkbutton per option with the icon
+        # embedded in the text, instead of a Frame + icon Label per card
         def create_option_card(parent, icon, text, var, row, col):
-            card = tk.Frame(parent, bg="white", relief="solid", bd=1)
-            card.grid(row=row, column=col, sticky="nsew", padx=4, pady=2)
-            
-            icon_label = tk.Label(card, text=icon, font=("Helvetica", 11), bg="white")
-            icon_label.pack(side="left", padx=(4, 2))
-            
-            check = ttk.Checkbutton(card, text=text, variable=var, style="Option.TCheckbutton")
-            check.pack(side="left", padx=(0, 4), pady=2)
-            
-            return card
+            check = ttk.Checkbutton(parent, text=f"{icon} {text}", variable=var,
+                                  style="Option.TCheckbutton")
+            check.grid(row=row, column=col, sticky="nsew", padx=4, pady=2)
+
+            return check
 
         self.system_files_var = tk.BooleanVar(value=False)
         self.encrypt_var = tk.BooleanVar(value=False)
         self.compression_var = tk.BooleanVar(value=False)
         self.incremental_var = tk.BooleanVar(value=False)
 
-        create_option_card(options_grid, "🔒", "Backup system files (/etc)", 
-                         self.system_files_var, 0, 0)
-        create_option_card(options_grid, "🔐", "Encrypt backup with GPG", 
+        self.system_files_check = create_option_card(
+            options_grid, "🔒", "Backup system files (/etc)",
+            self.system_files_var, 0, 0)
+        # /etc access is only probed when the user opts into system backups
+        self.system_files_var.trace_add("write", self._on_system_files_toggle)
+
+        create_option_card(options_grid, "🔐", "Encrypt backup with GPG",
                          self.encrypt_var, 0, 1)
         create_option_card(options_grid, "🗜️", "Use compression", 
                          self.compression_var, 1, 0)
@@ -411,12 +547,12 @@ class AutoStashGUI(tk.Tk):
         right_header.pack(side="right", padx=(0, 4))
 
         status_icon_label = tk.Label(right_header, text="⚠️", font=("Helvetica", 12), 
-                                   bg="white", fg=self.warning_color)
+                                   bg="white", fg=self.palette.warning)
         status_icon_label.pack(side="left", padx=(0, 4))
 
         self.last_backup_label = tk.Label(right_header, 
                                         text="No previous backups found", 
-                                        fg=self.error_color, bg="white", 
+                                        fg=self.palette.error, bg="white", 
                                         font=("Helvetica", 10))
         self.last_backup_label.pack(side="left")
 
@@ -466,6 +602,33 @@ class AutoStashGUI(tk.Tk):
             'time': create_status_indicator(indicators_frame, "⏱️", "Time: 0s", "#e74c3c")
         }
 
+    def _on_system_files_toggle(self, *args):
+        """Probe /etc access when system-file backup is switched on"""
+        if self.system_files_var.get() and not self._ensure_etc_readable():
+            self.system_files_var.set(False)
+
+    def _ensure_etc_readable(self):
+        """Make sure /etc is readable for system-file backups
+
+        Only called when the user enables the system-files option, so the
+        common startup path never probes or chmods /etc.
+        """
+        if os.access("/etc", os.R_OK):
+            return True
+        result = subprocess.run(
+            ["sudo", "chmod", "a+r", "/etc"],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            messagebox.showerror(
+                "Permission Error",
+                "Failed to set read permissions for /etc.\n"
+                "System file backup is unavailable."
+            )
+            return False
+        return True
+
     def _create_monitor_tab(self):
         # === Resource Monitor Frame ===
         self.resource_frame = ttk.LabelFrame(self.monitor_tab, text="System Resources", style="Card.TLabelframe")
@@ -485,12 +648,6 @@ class AutoStashGUI(tk.Tk):
                                font=("Helvetica", 12, "bold"), bg="white", fg="#2c3e50")
         monitor_title.pack(side="left")
 
-        # Create custom styles for progress bars
-        style = ttk.Style()
-        style.configure("CPU.Horizontal.TProgressbar", troughcolor='#f0f0f0', background='#3498db')
-        style.configure("MEM.Horizontal.TProgressbar", troughcolor='#f0f0f0', background='#2ecc71')
-        style.configure("DISK.Horizontal.TProgressbar", troughcolor='#f0f0f0', background='#e74c3c')
-
         # Create a modern card-style container for each resource
         def create_resource_card(parent, icon, title, color):
             card = tk.Frame(parent, bg="white", relief="solid", bd=1)
@@ -525,38 +682,33 @@ class AutoStashGUI(tk.Tk):
             progress_frame = tk.Frame(card, bg="white")
             progress_frame.pack(fill="x", pady=(0, 6), padx=8)
             
-            # Progress bar with custom style
+            # Progress bar with custom style, registered on first use
+            bar_style = _PROGRESSBAR_STYLES[title]
+            ensure_style(self, bar_style)
             progress_var = tk.DoubleVar()
             progress = ttk.Progressbar(progress_frame, variable=progress_var,
                                      length=300, maximum=100,
-                                     style=f"{title}.Horizontal.TProgressbar")
+                                     style=bar_style)
             progress.pack(fill="x", expand=True)
-            
+
+            # Usage bands: green for low, orange for medium, red for high
+            last_band = None
+
             # Add percentage indicator above progress bar
             def update_progress(value):
+                nonlocal last_band
                 progress_var.set(value)
                 value_label.config(text=f"{value:.1f}%")
-                
-                # Update colors based on value
-                if value < 50:
-                    # Green for low usage
-                    value_label.config(fg="#27ae60")
-                    style.configure(f"{title}.Horizontal.TProgressbar", 
-                                  background='#27ae60', troughcolor='#f0f0f0')
-                elif value < 80:
-                    # Orange for medium usage
-                    value_label.config(fg="#f39c12")
-                    style.configure(f"{title}.Horizontal.TProgressbar", 
-                                  background='#f39c12', troughcolor='#f0f0f0')
-                else:
-                    # Red for high usage
-                    value_label.config(fg="#e74c3c")
-                    style.configure(f"{title}.Horizontal.TProgressbar", 
-                                  background='#e74c3c', troughcolor='#f0f0f0')
-                
-                # Update progress bar color
-                progress.configure(style=f"{title}.Horizontal.TProgressbar")
-            
+
+                new_band = 0 if value < 50 else 1 if value < 80 else 2
+
+                # Only touch the style when the band actually changes
+                if new_band != last_band:
+                    value_label.config(fg=_BAND_COLORS[new_band])
+                    self._style.configure(bar_style,
+                                  background=_BAND_COLORS[new_band], troughcolor='#f0f0f0')
+                    last_band = new_band
+
             progress_var.trace_add("write", lambda *args: update_progress(progress_var.get()))
             
             return card, value_label, progress_var
@@ -571,15 +723,22 @@ class AutoStashGUI(tk.Tk):
         self.disk_card, self.disk_label, self.disk_progress_var = create_resource_card(
             resource_inner, "💾", "DISK", "#e74c3c")
 
+        # Prebuilt handles for update_resource_display's per-tick loop
+        self._resource_widgets = [
+            ('cpu', self.cpu_label, self.cpu_progress_var, 50, 80),
+            ('memory', self.memory_label, self.memory_progress_var, 60, 80),
+            ('disk', self.disk_label, self.disk_progress_var, 70, 90),
+        ]
+
         # Resource warning message with modern styling
         warning_frame = tk.Frame(resource_inner, bg="white")
         warning_frame.pack(fill="x", pady=(8, 2))
 
         warning_icon = tk.Label(warning_frame, text="⚠️", font=("Helvetica", 14), 
-                              bg="white", fg=self.warning_color)
+                              bg="white", fg=self.palette.warning)
         warning_icon.pack(side="left", padx=(0, 4))
 
-        self.resource_warning = tk.Label(warning_frame, text="", fg=self.error_color, 
+        self.resource_warning = tk.Label(warning_frame, text="", fg=self.palette.error, 
                                        bg="white", font=("Helvetica", 9))
         self.resource_warning.pack(side="left", fill="x")
 
@@ -675,7 +834,8 @@ class AutoStashGUI(tk.Tk):
         search_icon.pack(side="left", padx=5)
 
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", self._filter_backups)
+        self._search_after_id = None
+        self.search_var.trace_add("write", self._on_search_changed)
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side="left", padx=(0, 5), pady=2)
 
@@ -686,8 +846,13 @@ class AutoStashGUI(tk.Tk):
         self.timeline_scrollbar = tk.Scrollbar(timeline_container)
         self.timeline_scrollbar.pack(side="right", fill="y")
 
+        # Backing variable: swapping its value replaces the Listbox
+        # contents in a single Tcl operation
+        self._timeline_var = tk.Variable(value=())
+
         # Configure listbox colors
-        self.timeline_list = tk.Listbox(timeline_container, 
+        self.timeline_list = tk.Listbox(timeline_container,
+                                      listvariable=self._timeline_var,
                                       font=("Helvetica", 10),
                                       bg="white",
                                       fg="#2c3e50",  # Dark text color
@@ -696,7 +861,7 @@ class AutoStashGUI(tk.Tk):
                                       activestyle="none",
                                       bd=0,
                                       highlightthickness=0,
-                                      yscrollcommand=self.timeline_scrollbar.set)
+                                      yscrollcommand=self._on_timeline_scroll)
         self.timeline_list.pack(side="left", fill="both", expand=True)
         self.timeline_scrollbar.config(command=self.timeline_list.yview)
 
@@ -719,32 +884,162 @@ class AutoStashGUI(tk.Tk):
                                       bg="white", fg="#7f8c8d")
         self.timeline_status.pack(side="left")
 
+    def _parse_history(self):
+        """Parse backup history into (display text, raw line, dict) tuples
+
+        Entries are newest-first and memoized on the history file's mtime,
+        so the timeline, the restore dialog and the search filter all share
+        a single read and JSON parse. The dict is None for old-format
+        entries.
+        """
+        try:
+            mtime = os.stat(self._history_path).st_mtime
+        except OSError:
+            self._history_entries = None
+            self._history_entries_lower = None
+            self._history_cache_mtime = 0
+            return None, None
+
+        if self._history_entries is None or mtime != self._history_cache_mtime:
+            # Slurp once and decode in one pass instead of per-line
+            # iteration with double strip() calls
+            with open(self._history_path, "rb") as f:
+                raw = f.read()
+            lines = [line for line in map(str.strip, raw.decode().splitlines())
+                     if line]
+
+            entries = []
+            time_index = []
+            for line in reversed(lines):
+                try:
+                    backup_data = json.loads(line)
+                    # Format timestamp for display
+                    display_time = _fmt_ts(backup_data['timestamp'])
+
+                    # Create a formatted display string
+                    display_text = (
+                        f"Backup: {display_time} | "
+                        f"Type: {backup_data['type']} | "
+                        f"Files: {backup_data['total_files']} | "
+                        f"Size: {backup_data['total_size']}"
+                    )
+                    time_index.append((display_time, len(entries)))
+                    entries.append((display_text, line, backup_data))
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    # Handle old format entries
+                    entries.append((line, line, None))
+
+            time_index.sort()
+            self._history_entries = entries
+            self._history_entries_lower = [e[0].lower() for e in entries]
+            self._history_time_index = time_index
+            self._history_cache_mtime = mtime
+            # The previously filtered subset no longer matches the cache
+            self._last_search = ""
+            self._last_filtered = []
+
+        return self._history_entries, self._history_entries_lower
+
+    def _display_timeline(self, entries):
+        """Show history entries in the timeline Listbox, windowed
+
+        The full list is kept in the parallel raw/parsed/display lists;
+        only the first _TIMELINE_CHUNK rows go into the Listbox, with
+        further chunks appended as the user scrolls near the bottom.
+        """
+        self._timeline_raw = [raw for _display, raw, _data in entries]
+        self._timeline_parsed = [data for _display, _raw, data in entries]
+        self._timeline_display = [display for display, _raw, _data in entries]
+        self._timeline_shown = 0
+        self._timeline_var.set(())
+        self._append_timeline_chunk()
+
+    def _append_timeline_chunk(self):
+        """Grow the timeline Listbox by one window of rows
+
+        The whole visible slice is swapped in through the listvariable,
+        one Tcl call instead of delete + per-row inserts.
+        """
+        start = self._timeline_shown
+        if start >= len(self._timeline_display):
+            return
+        self._timeline_shown = min(start + _TIMELINE_CHUNK,
+                                   len(self._timeline_display))
+        self._timeline_var.set(tuple(self._timeline_display[:self._timeline_shown]))
+
+    def _on_timeline_scroll(self, first, last):
+        """Relay scroll info to the scrollbar and extend near the bottom"""
+        self.timeline_scrollbar.set(first, last)
+        if float(last) > 0.9:
+            self._append_timeline_chunk()
+
+    def _on_search_changed(self, *args):
+        """Debounce search keystrokes into a single filter pass"""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self._filter_backups)
+
     def _filter_backups(self, *args):
         """Filter backup entries based on search text"""
+        self._search_after_id = None
         search_text = self.search_var.get().lower()
-        self.timeline_list.delete(0, tk.END)
-        
-        history_path = os.path.expanduser("~/.autostash/backup_history")
-        if os.path.exists(history_path):
-            with open(history_path, "r") as f:
-                lines = [line.strip() for line in f if line.strip()]
-            
-            # Filter and show matching entries
-            filtered_entries = [line for line in reversed(lines) 
-                              if search_text in line.lower()]
-            
-            for line in filtered_entries:
-                self.timeline_list.insert(tk.END, line)
-            
-            # Update status
-            self.timeline_status.config(
-                text=f"Showing {len(filtered_entries)} of {len(lines)} backups"
-            )
-        else:
+
+        # Spurious trace fires (same query, unchanged file) cost one stat
+        if search_text and search_text == self._last_search:
+            try:
+                if os.path.getmtime(self._history_path) == self._history_cache_mtime:
+                    return
+            except OSError:
+                pass
+
+        entries, entries_lower = self._parse_history()
+        if entries is None:
+            self._display_timeline([])
             self.timeline_status.config(text="No backup history found")
+            return
+
+        if _DATE_PREFIX_RE.fullmatch(search_text):
+            # Date-like query: bisect the sorted timestamp index instead of
+            # scanning every entry; ascending entry index is newest-first
+            index = self._history_time_index
+            lo = bisect.bisect_left(index, (search_text,))
+            hi = bisect.bisect_left(index, (search_text + "\uffff",))
+            idxs = sorted(idx for _time, idx in index[lo:hi])
+            filtered = [(entries[i], entries_lower[i]) for i in idxs]
+            # Prefix matches aren't a substring-filter superset, so don't
+            # let later keystrokes refine from this subset
+            self._last_search = ""
+            self._last_filtered = []
+        else:
+            # Refinement keystrokes narrow the previously displayed subset;
+            # anything else (backspace, paste) refilters the full cache
+            if self._last_search and search_text.startswith(self._last_search):
+                candidates = self._last_filtered
+            else:
+                candidates = list(zip(entries, entries_lower))
+
+            # C-bound scan: the compiled pattern is dispatched through
+            # map/compress, with no Python frame per entry
+            rx = re.compile(re.escape(search_text))
+            filtered = list(itertools.compress(
+                candidates,
+                map(rx.search, map(operator.itemgetter(1), candidates))))
+            self._last_search = search_text
+            self._last_filtered = filtered
+
+        self._display_timeline([entry for entry, _ in filtered])
+
+        # Update status
+        self.timeline_status.config(
+            text=f"Showing {len(filtered)} of {len(entries)} backups"
+        )
 
     def load_backup_timeline(self):
         """Load backup history into the timeline"""
+        # Nothing to refresh until the history tab has been built
+        if not self._built['history']:
+            return
+
         try:
             # Sync with repository history first
             self.backup.sync_backup_history()
@@ -752,40 +1047,16 @@ class AutoStashGUI(tk.Tk):
             # Verify and repair history file if needed
             self.backup.verify_and_repair_history()
             
-            self.timeline_list.delete(0, tk.END)
-            history_path = os.path.expanduser("~/.autostash/backup_history")
-            if os.path.exists(history_path):
-                with open(history_path, "r") as f:
-                    lines = [line.strip() for line in f if line.strip()]
-                
-                # Show latest entries at the top
-                for line in reversed(lines):
-                    try:
-                        backup_data = json.loads(line)
-                        # Format timestamp for display
-                        display_time = datetime.datetime.strptime(
-                            backup_data['timestamp'], "%Y%m%d_%H%M"
-                        ).strftime("%Y-%m-%d %H:%M")
-                        
-                        # Create a formatted display string
-                        display_text = (
-                            f"Backup: {display_time} | "
-                            f"Type: {backup_data['type']} | "
-                            f"Files: {backup_data['total_files']} | "
-                            f"Size: {backup_data['total_size']}"
-                        )
-                        
-                        # Store the full backup data as a tuple with the display text
-                        self.timeline_list.insert(tk.END, (display_text, line))
-                    except json.JSONDecodeError:
-                        # Handle old format entries
-                        self.timeline_list.insert(tk.END, (line, line))
-                
+            entries, _ = self._parse_history()
+            if entries is not None:
+                self._display_timeline(entries)
+
                 # Update status
                 self.timeline_status.config(
-                    text=f"Showing {len(lines)} backups"
+                    text=f"Showing {len(entries)} backups"
                 )
             else:
+                self._display_timeline([])
                 self.timeline_status.config(text="No backup history found")
                 
         except Exception as e:
@@ -794,17 +1065,21 @@ class AutoStashGUI(tk.Tk):
 
     def add_folder(self):
         folder = filedialog.askdirectory()
-        if folder and folder not in self.folder_list.get(0, tk.END):
+        if folder and folder not in self._folders:
+            self._folders.add(folder)
+            self._folders_order.append(folder)
             self.folder_list.insert(tk.END, folder)
             self.folder_entry.delete(0, tk.END)
             self.folder_entry.insert(0, folder)
-            self.config.save_folders(self.folder_list.get(0, tk.END))
+            self.config.save_folders(self._folders_order)
 
     def remove_folder(self):
         sel = self.folder_list.curselection()
         if sel:
+            folder = self._folders_order.pop(sel[0])
+            self._folders.discard(folder)
             self.folder_list.delete(sel)
-            self.config.save_folders(self.folder_list.get(0, tk.END))
+            self.config.save_folders(self._folders_order)
             self.folder_entry.delete(0, tk.END)
 
     def connect_github(self):
@@ -823,10 +1098,12 @@ class AutoStashGUI(tk.Tk):
             if repos:
                 self.repo_combobox.current(0)
             # Update button appearance for connected state
+            ensure_style(self, "Connected.TButton")
             self.connect_btn.configure(text="Connected ✓", style="Connected.TButton")
             self.status_var.set("GitHub connected. Select a repository.")
         except Exception as e:
             # Update button appearance for error state
+            ensure_style(self, "Error.TButton")
             self.connect_btn.configure(text="Connection Failed", style="Error.TButton")
             self.status_var.set(f"GitHub error: {e}")
 
@@ -856,7 +1133,10 @@ class AutoStashGUI(tk.Tk):
             messagebox.showerror("Error", str(e))
 
     def run_backup(self):
-        folders = self.folder_list.get(0, tk.END)
+        # Ignore clicks while a backup is already in flight
+        if getattr(self, 'is_backup_running', False):
+            return
+        folders = list(self._folders_order)
         repo = self.repo_combobox.get()
         if not folders:
             messagebox.showerror("Missing Info", "Please select at least one folder to backup.")
@@ -879,14 +1159,14 @@ class AutoStashGUI(tk.Tk):
         self.is_backup_running = True  # Flag for resource monitoring
 
         # Clear previous resource warnings
-        self.resource_warning.config(text="")
+        self._set_resource_warning("")
 
-        def progress_callback(percent, message=None):
-            self.progress_var.set(percent)
-            if message:
-                self.progress_text.config(text=message)
+        # Timestamp of the last UI progress post, for ~30 Hz rate limiting
+        self._last_ui_update = 0.0
 
-            # Get current resource usage during backup
+        def progress_callback(percent, message=None):
+            # Runs on the backup worker thread: sample resources here and
+            # marshal all widget updates onto the Tk thread via after()
             resources = self.resource_monitor.get_current_usage()
 
             # Show warning if resources are critically high during backup
@@ -898,42 +1178,64 @@ class AutoStashGUI(tk.Tk):
             if resources['disk'] > 95:
                 warnings.append(f"Disk usage critical: {resources['disk']:.1f}%")
 
-            if warnings:
-                warning_text = " | ".join(warnings)
-                self.resource_warning.config(text=f"⚠️ {warning_text} - Backup may be affected")
-                # Optionally slow down the backup process when resources are critical
-                time.sleep(0.5)  # Brief pause to ease system load
+            # Coalesce bursts of ticks to ~30 Hz; completion always flushes
+            now = time.monotonic()
+            if percent >= 100 or now - self._last_ui_update >= 0.033:
+                self._last_ui_update = now
 
-            self.update_idletasks()
+                def apply_update():
+                    self.progress_var.set(percent)
+                    if message:
+                        self.progress_text.config(text=message)
+                    if warnings:
+                        warning_text = " | ".join(warnings)
+                        self._set_resource_warning(
+                            f"⚠️ {warning_text} - Backup may be affected")
 
-        try:
-            # Get all backup options
-            backup_system = self.system_files_var.get()
-            encrypt = self.encrypt_var.get()
-            compress = self.compression_var.get()
-            incremental = self.incremental_var.get()
-
-            # Run backup with all options
-            self.backup.run(
-                folders, repo,
-                backup_system=backup_system,
-                encrypt=encrypt,
-                compress=compress,
-                incremental=incremental,
-                progress_callback=progress_callback
-            )
-            self.status_var.set("Backup completed successfully!")
-            self.progress_text.config(text="Backup complete ✓", fg="#27ae60")
-            messagebox.showinfo("Backup", "Backup completed successfully!")
-            self.check_backup_status()
-            self.load_backup_timeline()
-        except Exception as e:
-            self.status_var.set(f"Backup failed: {e}")
-            self.progress_text.config(text="Backup failed ⚠️", fg="#c0392b")
-            messagebox.showerror("Backup Failed", str(e))
-        finally:
+                self.after(0, apply_update)
+
+            if warnings:
+                # Slow the worker down while resources are critical; the
+                # UI thread keeps running
+                time.sleep(0.5)
+
+        def on_backup_done(error):
+            if error is None:
+                self.status_var.set("Backup completed successfully!")
+                self.progress_text.config(text="Backup complete ✓", fg="#27ae60")
+                messagebox.showinfo("Backup", "Backup completed successfully!")
+                self.check_backup_status()
+                self.load_backup_timeline()
+            else:
+                self.status_var.set(f"Backup failed: {error}")
+                self.progress_text.config(text="Backup failed ⚠️", fg="#c0392b")
+                messagebox.showerror("Backup Failed", str(error))
             self.is_backup_running = False  # Reset backup flag
-            self.resource_warning.config(text="")  # Clear any resource warnings
+            self._set_resource_warning("")  # Clear any resource warnings
+
+        # Get all backup options
+        backup_system = self.system_files_var.get()
+        encrypt = self.encrypt_var.get()
+        compress = self.compression_var.get()
+        incremental = self.incremental_var.get()
+
+        def backup_worker():
+            # Run backup with all options off the UI thread
+            try:
+                self.backup.run(
+                    folders, repo,
+                    backup_system=backup_system,
+                    encrypt=encrypt,
+                    compress=compress,
+                    incremental=incremental,
+                    progress_callback=progress_callback
+                )
+            except Exception as e:
+                self.after(0, lambda: on_backup_done(e))
+            else:
+                self.after(0, lambda: on_backup_done(None))
+
+        threading.Thread(target=backup_worker, daemon=True).start()
 
     def restore_backup(self):
         repo = self.repo_combobox.get()
@@ -941,12 +1243,39 @@ class AutoStashGUI(tk.Tk):
             messagebox.showerror("Missing Repo", "Please select a GitHub repository first.")
             return
 
-        # Create backup selection window
+        # Build the selection window once; later opens just refresh it
+        self._ensure_restore_window()
+
+        # Refresh contents from the shared parsed cache
+        entries, _ = self._parse_history()
+        self._restore_dialog_entries = entries or []
+        self._restore_list.delete(0, tk.END)
+        if self._restore_dialog_entries:
+            self._restore_list.insert(
+                tk.END,
+                *[display for display, _raw, _data in self._restore_dialog_entries])
+        self._restore_details_text.delete("1.0", tk.END)
+        self._restore_status_label.config(text="")
+
+        self._restore_window.deiconify()
+        self._restore_window.grab_set()
+
+    def _ensure_restore_window(self):
+        """Create the backup selection window on first use
+
+        Widget construction is the expensive part of opening the dialog,
+        so the Toplevel is built once and hidden with withdraw() instead
+        of destroyed; restore_backup refreshes its contents per open.
+        """
+        if self._restore_window is not None:
+            return
+
         backup_window = tk.Toplevel(self)
         backup_window.title("Select Backup to Restore")
         backup_window.geometry("1000x700")
         backup_window.transient(self)
-        backup_window.grab_set()
+        backup_window.protocol("WM_DELETE_WINDOW", self._hide_restore_window)
+        self._restore_window = backup_window
 
         # Header
         header_frame = tk.Frame(backup_window, bg="white")
@@ -974,7 +1303,7 @@ class AutoStashGUI(tk.Tk):
         scrollbar = tk.Scrollbar(list_frame)
         scrollbar.pack(side="right", fill="y")
 
-        backup_list = tk.Listbox(list_frame, 
+        self._restore_list = tk.Listbox(list_frame, 
                                font=("Helvetica", 10),
                                bg="white",
                                fg="#2c3e50",
@@ -984,8 +1313,8 @@ class AutoStashGUI(tk.Tk):
                                bd=0,
                                highlightthickness=0,
                                yscrollcommand=scrollbar.set)
-        backup_list.pack(side="left", fill="both", expand=True)
-        scrollbar.config(command=backup_list.yview)
+        self._restore_list.pack(side="left", fill="both", expand=True)
+        scrollbar.config(command=self._restore_list.yview)
 
         # Right side: Backup details
         details_frame = tk.Frame(content_frame, bg="white")
@@ -999,7 +1328,7 @@ class AutoStashGUI(tk.Tk):
         details_scrollbar = tk.Scrollbar(details_frame)
         details_scrollbar.pack(side="right", fill="y")
 
-        details_text = tk.Text(details_frame, 
+        self._restore_details_text = tk.Text(details_frame, 
                              font=("Helvetica", 10),
                              bg="white",
                              fg="#2c3e50",
@@ -1007,171 +1336,147 @@ class AutoStashGUI(tk.Tk):
                              height=25,
                              width=60,
                              yscrollcommand=details_scrollbar.set)
-        details_text.pack(fill="both", expand=True)
-        details_scrollbar.config(command=details_text.yview)
-
-        # Load backup history into list
-        history_path = os.path.expanduser("~/.autostash/backup_history")
-        if os.path.exists(history_path):
-            with open(history_path, "r") as f:
-                lines = [line.strip() for line in f if line.strip()]
-            
-            # Show latest entries at the top
-            for line in reversed(lines):
-                try:
-                    backup_data = json.loads(line)
-                    # Format timestamp for display
-                    display_time = datetime.datetime.strptime(
-                        backup_data['timestamp'], "%Y%m%d_%H%M"
-                    ).strftime("%Y-%m-%d %H:%M")
-                    
-                    # Create a formatted display string
-                    display_text = (
-                        f"Backup: {display_time} | "
-                        f"Type: {backup_data['type']} | "
-                        f"Files: {backup_data['total_files']}"
-                    )
-                    
-                    # Store the full backup data as a tuple with the display text
-                    backup_list.insert(tk.END, (display_text, line))
-                except json.JSONDecodeError:
-                    backup_list.insert(tk.END, (line, line))
-
-        def show_backup_details(event):
-            selection = backup_list.curselection()
-            if selection:
-                backup_entry = backup_list.get(selection)[1]
-                try:
-                    backup_data = json.loads(backup_entry)
-                    # Format timestamp for display
-                    display_time = datetime.datetime.strptime(
-                        backup_data['timestamp'], "%Y%m%d_%H%M"
-                    ).strftime("%Y-%m-%d %H:%M")
-                    
-                    # Create detailed information
-                    details = (
-                        f"Backup Details\n"
-                        f"==============\n\n"
-                        f"Timestamp: {display_time}\n"
-                        f"Type: {backup_data['type']}\n"
-                        f"Total Files: {backup_data['total_files']}\n"
-                        f"Changed Files: {backup_data['changed_files']}\n"
-                        f"Total Size: {backup_data['total_size']}\n"
-                        f"Backup Name: {backup_data.get('backup_name', 'N/A')}\n\n"
-                        f"Backed up folders:\n"
-                        f"-----------------\n"
-                    )
-                    for folder_name, original_path in backup_data['folders'].items():
-                        details += f"• {folder_name}: {original_path}\n"
-                    
-                    details_text.delete("1.0", tk.END)
-                    details_text.insert("1.0", details)
-                except json.JSONDecodeError:
-                    details_text.delete("1.0", tk.END)
-                    details_text.insert("1.0", "Invalid backup entry format")
+        self._restore_details_text.pack(fill="both", expand=True)
+        details_scrollbar.config(command=self._restore_details_text.yview)
 
-        backup_list.bind("<<ListboxSelect>>", show_backup_details)
+        self._restore_list.bind("<<ListboxSelect>>", self._show_restore_details)
 
         # Status label
-        status_label = tk.Label(backup_window, text="", bg="white", fg="#7f8c8d")
-        status_label.pack(pady=5)
+        self._restore_status_label = tk.Label(backup_window, text="", bg="white", fg="#7f8c8d")
+        self._restore_status_label.pack(pady=5)
 
         # Button frame
         button_frame = tk.Frame(backup_window, bg="white")
         button_frame.pack(fill="x", pady=15, padx=15)
 
-        def on_restore():
-            selection = backup_list.curselection()
-            if not selection:
-                messagebox.showwarning("No Selection", "Please select a backup to restore.")
-                return
-
-            backup_entry = backup_list.get(selection)[1]
-            try:
-                backup_data = json.loads(backup_entry)
-                
-                # Ask for confirmation
-                confirm_msg = (
-                    f"Are you sure you want to restore this backup?\n\n"
-                    f"Timestamp: {datetime.datetime.strptime(backup_data['timestamp'], '%Y%m%d_%H%M').strftime('%Y-%m-%d %H:%M')}\n"
-                    f"Type: {backup_data['type']}\n"
-                    f"Total Files: {backup_data['total_files']}\n\n"
-                    f"This will restore files to their original locations:\n"
-                )
-                for folder_name, original_path in backup_data['folders'].items():
-                    confirm_msg += f"- {original_path}\n"
-                
-                if not messagebox.askyesno("Confirm Restore", confirm_msg):
-                    return
-
-                self.status_var.set("Restoring backup...")
-                status_label.config(text="Restoring backup...", fg="#3498db")
-                backup_window.update_idletasks()
-
-                try:
-                    # Get the backup folder name from metadata
-                    backup_folder = backup_data.get('backup_name')
-                    if not backup_folder:
-                        raise Exception("Backup folder name not found in metadata")
-
-                    # Call restore with the specific backup folder
-                    result = self.backup.restore(repo, backup_folder)
-                    
-                    self.status_var.set("Restore completed successfully!")
-                    status_label.config(text="Restore completed successfully!", fg="#27ae60")
-                    
-                    # Show success message with details
-                    success_msg = (
-                        f"Backup has been restored successfully!\n\n"
-                        f"Files restored: {result['files_restored']}\n"
-                        f"Total size: {result['total_size']} bytes\n"
-                        f"Restore path: {result['path']}\n\n"
-                        f"Would you like to open the restore location?"
-                    )
-                    
-                    if messagebox.askyesno("Restore Complete", success_msg):
-                        # Open the restore location in Finder
-                        subprocess.run(["open", result['path']])
-                    
-                    # Close the backup selection window
-                    backup_window.destroy()
-                    
-                except Exception as e:
-                    self.status_var.set(f"Restore failed: {e}")
-                    status_label.config(text=f"Restore failed: {e}", fg="#e74c3c")
-                    messagebox.showerror("Restore Failed", str(e))
-                
-            except Exception as e:
-                self.status_var.set(f"Restore failed: {e}")
-                status_label.config(text=f"Restore failed: {e}", fg="#e74c3c")
-                messagebox.showerror("Restore Failed", str(e))
-
-        def on_cancel():
-            backup_window.destroy()
-
         # Add buttons
         restore_btn = ttk.Button(button_frame, text="Restore Selected", 
-                               command=on_restore, style="Restore.TButton")
+                               command=self._on_restore_selected, **self._btn_kw['restore'])
         restore_btn.pack(side="left", padx=5)
 
         cancel_btn = ttk.Button(button_frame, text="Cancel", 
-                              command=on_cancel)
+                              command=self._hide_restore_window)
         cancel_btn.pack(side="right", padx=5)
 
         # Add double-click handler
-        def on_double_click(event):
-            on_restore()
-
-        backup_list.bind("<Double-1>", on_double_click)
+        self._restore_list.bind("<Double-1>", lambda event: self._on_restore_selected())
 
         # Center the window
         backup_window.update_idletasks()
         width = backup_window.winfo_width()
         height = backup_window.winfo_height()
-        x = (backup_window.winfo_screenwidth() // 2) - (width // 2)
-        y = (backup_window.winfo_screenheight() // 2) - (height // 2)
+        x = (self._screen_w // 2) - (width // 2)
+        y = (self._screen_h // 2) - (height // 2)
         backup_window.geometry(f'{width}x{height}+{x}+{y}')
 
+    def _hide_restore_window(self):
+        """Hide the restore dialog, keeping its widgets for the next open"""
+        self._restore_window.grab_release()
+        self._restore_window.withdraw()
+
+    def _show_restore_details(self, event=None):
+        selection = self._restore_list.curselection()
+        if selection:
+            details_text = self._restore_details_text
+            backup_data = self._restore_dialog_entries[selection[0]][2]
+            if backup_data is None:
+                details_text.delete("1.0", tk.END)
+                details_text.insert("1.0", "Invalid backup entry format")
+                return
+
+            # Format timestamp for display
+            display_time = _fmt_ts(backup_data['timestamp'])
+
+            # Create detailed information
+            details = (
+                f"Backup Details\n"
+                f"==============\n\n"
+                f"Timestamp: {display_time}\n"
+                f"Type: {backup_data['type']}\n"
+                f"Total Files: {backup_data['total_files']}\n"
+                f"Changed Files: {backup_data['changed_files']}\n"
+                f"Total Size: {backup_data['total_size']}\n"
+                f"Backup Name: {backup_data.get('backup_name', 'N/A')}\n\n"
+                f"Backed up folders:\n"
+                f"-----------------\n"
+            )
+            for folder_name, original_path in backup_data['folders'].items():
+                details += f"• {folder_name}: {original_path}\n"
+
+            details_text.delete("1.0", tk.END)
+            details_text.insert("1.0", details)
+
+    def _on_restore_selected(self):
+        selection = self._restore_list.curselection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select a backup to restore.")
+            return
+
+        backup_data = self._restore_dialog_entries[selection[0]][2]
+        if backup_data is None:
+            messagebox.showerror("Restore Failed", "Invalid backup entry format")
+            return
+
+        repo = self.repo_combobox.get()
+        status_label = self._restore_status_label
+        try:
+            # Ask for confirmation
+            confirm_msg = (
+                f"Are you sure you want to restore this backup?\n\n"
+                f"Timestamp: {_fmt_ts(backup_data['timestamp'])}\n"
+                f"Type: {backup_data['type']}\n"
+                f"Total Files: {backup_data['total_files']}\n\n"
+                f"This will restore files to their original locations:\n"
+            )
+            for folder_name, original_path in backup_data['folders'].items():
+                confirm_msg += f"- {original_path}\n"
+
+            if not messagebox.askyesno("Confirm Restore", confirm_msg):
+                return
+
+            self.status_var.set("Restoring backup...")
+            status_label.config(text="Restoring backup...", fg="#3498db")
+            self._restore_window.update_idletasks()
+
+            try:
+                # Get the backup folder name from metadata
+                backup_folder = backup_data.get('backup_name')
+                if not backup_folder:
+                    raise Exception("Backup folder name not found in metadata")
+
+                # Call restore with the specific backup folder
+                result = self.backup.restore(repo, backup_folder)
+
+                self.status_var.set("Restore completed successfully!")
+                status_label.config(text="Restore completed successfully!", fg="#27ae60")
+
+                # Show success message with details
+                success_msg = (
+                    f"Backup has been restored successfully!\n\n"
+                    f"Files restored: {result['files_restored']}\n"
+                    f"Total size: {result['total_size']} bytes\n"
+                    f"Restore path: {result['path']}\n\n"
+                    f"Would you like to open the restore location?"
+                )
+
+                if messagebox.askyesno("Restore Complete", success_msg):
+                    # Open the restore location in Finder
+                    subprocess.run(["open", result['path']])
+
+                # Close the backup selection window
+                self._hide_restore_window()
+
+            except Exception as e:
+                self.status_var.set(f"Restore failed: {e}")
+                status_label.config(text=f"Restore failed: {e}", fg="#e74c3c")
+                messagebox.showerror("Restore Failed", str(e))
+
+        except Exception as e:
+            self.status_var.set(f"Restore failed: {e}")
+            status_label.config(text=f"Restore failed: {e}", fg="#e74c3c")
+            messagebox.showerror("Restore Failed", str(e))
+
+
     def set_schedule(self):
         """Set up automated backup schedule"""
         try:
@@ -1230,49 +1535,68 @@ class AutoStashGUI(tk.Tk):
         self.next_backup_time = next_time
 
     def _start_schedule_timer(self):
-        """Start the timer to update the next backup time display"""
+        """Start the timer to update the next backup time display
+
+        Each tick reschedules itself as a one-shot after() aligned to
+        the next minute boundary — the moment the displayed countdown
+        actually changes — instead of waking on a free-running
+        60-second cadence that drifts against the label.
+        """
         if self.schedule_timer:
             self.after_cancel(self.schedule_timer)
-        
+
         def update_timer():
+            # Default wakeup when no schedule is configured
+            next_ms = 60000
+
             if self.next_backup_time:
                 now = datetime.datetime.now()
                 time_left = self.next_backup_time - now
-                
+
                 if time_left.total_seconds() <= 0:
                     # Recalculate next backup time
                     schedule_config = self.config.get_settings().get('schedule', {})
                     self._calculate_next_backup_time(schedule_config)
                     time_left = self.next_backup_time - now
-                
+
                 # Format the time remaining
                 days = time_left.days
                 hours = time_left.seconds // 3600
                 minutes = (time_left.seconds % 3600) // 60
-                
+
                 if days > 0:
                     time_str = f"{days}d {hours}h {minutes}m"
                 elif hours > 0:
                     time_str = f"{hours}h {minutes}m"
                 else:
                     time_str = f"{minutes}m"
-                
-                # Update the status label
-                self.status_var.set(f"Next backup in: {time_str}")
-            
+
+                # Update the status label only when the text changed
+                if time_str != self._last_time_str:
+                    self._last_time_str = time_str
+                    self.status_var.set(f"Next backup in: {time_str}")
+
+                # The display shows minutes at every scale, so wake at
+                # the next minute boundary when it actually changes
+                next_ms = (time_left.seconds % 60 or 60) * 1000
+
             # Schedule next update
-            self.schedule_timer = self.after(60000, update_timer)  # Update every minute
-        
+            self.schedule_timer = self.after(next_ms, update_timer)
+
         # Start the timer
+        self._last_time_str = None
         update_timer()
 
     def load_saved_settings(self):
         """Load saved settings and initialize schedule timer"""
         folders = self.config.get_folders()
-        for folder in folders:
-            self.folder_list.insert(tk.END, folder)
+        self._folders_order = list(folders)
+        self._folders = set(folders)
+        if folders:
+            # Single varargs insert instead of one Tcl call per folder
+            self.folder_list.insert(tk.END, *folders)
             self.folder_entry.delete(0, tk.END)
-            self.folder_entry.insert(0, folder)
+            self.folder_entry.insert(0, folders[-1])
         
         # Load schedule settings
         settings = self.config.get_settings()
@@ -1293,29 +1617,21 @@ class AutoStashGUI(tk.Tk):
             if not self.winfo_exists():
                 return
 
-            # Update labels with current usage
-            if hasattr(self, 'cpu_label') and self.cpu_label.winfo_exists():
-                self.cpu_label.config(text=f"{cpu:.1f}%")
-            if hasattr(self, 'memory_label') and self.memory_label.winfo_exists():
-                self.memory_label.config(text=f"{memory:.1f}%")
-            if hasattr(self, 'disk_label') and self.disk_label.winfo_exists():
-                self.disk_label.config(text=f"{disk:.1f}%")
-
-            # Update progress bars
-            if hasattr(self, 'cpu_progress_var'):
-                self.cpu_progress_var.set(cpu)
-            if hasattr(self, 'memory_progress_var'):
-                self.memory_progress_var.set(memory)
-            if hasattr(self, 'disk_progress_var'):
-                self.disk_progress_var.set(disk)
-
-            # Set colors based on thresholds
-            if hasattr(self, 'cpu_label') and self.cpu_label.winfo_exists():
-                self._set_resource_color(self.cpu_label, cpu, 50, 80)
-            if hasattr(self, 'memory_label') and self.memory_label.winfo_exists():
-                self._set_resource_color(self.memory_label, memory, 60, 80)
-            if hasattr(self, 'disk_label') and self.disk_label.winfo_exists():
-                self._set_resource_color(self.disk_label, disk, 70, 90)
+            # Push label text, progress value and color only when the
+            # rendered 0.1%-granularity text actually changed, iterating
+            # the handles prebuilt when the monitor tab was constructed
+            values = {'cpu': cpu, 'memory': memory, 'disk': disk}
+            for key, label, progress_var, warn, crit in self._resource_widgets:
+                value = values[key]
+                text = f"{value:.1f}%"
+                if self._last_resource_strs.get(key) == text:
+                    continue
+                self._last_resource_strs[key] = text
+
+                if label.winfo_exists():
+                    label.config(text=text)
+                    self._set_resource_color(label, value, warn, crit)
+                progress_var.set(value)
 
             # Display warning if threshold exceeded during backup
             if hasattr(self, 'is_backup_running') and self.is_backup_running:
@@ -1327,34 +1643,47 @@ class AutoStashGUI(tk.Tk):
                 if disk > 90:
                     warnings.append(f"Disk usage critical: {disk:.1f}%")
 
-                if warnings and hasattr(self, 'resource_warning') and self.resource_warning.winfo_exists():
-                    self.resource_warning.config(text=f"⚠️ {' | '.join(warnings)}")
-                elif hasattr(self, 'resource_warning') and self.resource_warning.winfo_exists():
-                    self.resource_warning.config(text="")
+                if warnings:
+                    self._set_resource_warning(f"⚠️ {' | '.join(warnings)}")
+                else:
+                    self._set_resource_warning("")
 
         except Exception as e:
             print(f"Error updating resource display: {str(e)}")
 
+    def _set_resource_warning(self, text):
+        """Update the monitor-tab warning label if it has been built
+
+        The monitor tab is constructed lazily, so the label may not
+        exist yet when a backup starts or finishes.
+        """
+        if hasattr(self, 'resource_warning') and self.resource_warning.winfo_exists():
+            self.resource_warning.config(text=text)
+
     def _set_resource_color(self, label, value, warning_threshold, critical_threshold):
         """Set the color of a resource label based on the value"""
         try:
             if not label.winfo_exists():
                 return
-                
-            if value < warning_threshold:
-                label.config(fg="#27ae60")  # Green
-            elif value < critical_threshold:
-                label.config(fg="#f39c12")  # Orange/Yellow
-            else:
-                label.config(fg="#e74c3c")  # Red
+
+            # Branchless band lookup: green / orange / red
+            color = _BAND_COLORS[(value >= warning_threshold) +
+                                 (value >= critical_threshold)]
+            self._set_label_fg(label, color)
         except Exception as e:
             print(f"Error setting resource color: {str(e)}")
 
+    def _set_label_fg(self, label, color):
+        """Reconfigure a label's color only when it actually changes"""
+        if self._last_resource_colors.get(label) != color:
+            self._last_resource_colors[label] = color
+            label.config(fg=color)
+
     def destroy(self):
-        """Override destroy to stop resource monitoring thread"""
+        """Override destroy to cancel the resource polling callback"""
         try:
-            if hasattr(self, 'resource_monitor'):
-                self.resource_monitor.stop_monitoring()
+            if self._resource_tick_id is not None:
+                self.after_cancel(self._resource_tick_id)
             super().destroy()
         except Exception as e:
             print(f"Error during window destruction: {str(e)}")
@@ -1371,119 +1700,177 @@ class AutoStashGUI(tk.Tk):
         """Show details for the selected backup"""
         sel = self.timeline_list.curselection()
         if sel:
-            backup_entry = self.timeline_list.get(sel)[1]  # Get the full backup data
-            try:
-                # Parse the JSON backup entry
-                backup_data = json.loads(backup_entry)
-                
-                # Create a details window
-                details_window = tk.Toplevel(self)
-                details_window.title("Backup Details")
-                details_window.geometry("600x500")
-                details_window.transient(self)
-                details_window.grab_set()
-
-                # Add details content
-                header_frame = tk.Frame(details_window, bg="white")
-                header_frame.pack(fill="x", pady=10, padx=15)
-
-                icon_label = tk.Label(header_frame, text="📋", font=("Helvetica", 16), bg="white")
-                icon_label.pack(side="left", padx=(0, 10))
-
-                title_label = tk.Label(header_frame, text="Backup Details", 
-                                     font=("Helvetica", 14, "bold"), bg="white", fg="#2c3e50")
-                title_label.pack(side="left")
-
-                # Details content
-                content_frame = tk.Frame(details_window, bg="white")
-                content_frame.pack(fill="both", expand=True, padx=15, pady=10)
-
-                # Create detail rows with icons
-                def create_detail_row(parent, icon, label, value, row):
-                    frame = tk.Frame(parent, bg="white")
-                    frame.pack(fill="x", pady=5)
-                    
-                    icon_label = tk.Label(frame, text=icon, font=("Helvetica", 12), bg="white")
-                    icon_label.pack(side="left", padx=(0, 8))
-                    
-                    label_text = tk.Label(frame, text=label, font=("Helvetica", 10, "bold"),
-                                        bg="white", fg="#7f8c8d", width=15, anchor="w")
-                    label_text.pack(side="left", padx=(0, 10))
-                    
-                    value_text = tk.Label(frame, text=value, font=("Helvetica", 10),
-                                        bg="white", fg="#2c3e50")
-                    value_text.pack(side="left")
-
-                # Format timestamp for display
-                display_time = datetime.datetime.strptime(
-                    backup_data['timestamp'], "%Y%m%d_%H%M"
-                ).strftime("%Y-%m-%d %H:%M")
-
-                # Add all backup details
-                create_detail_row(content_frame, "🕒", "Date:", display_time, 0)
-                create_detail_row(content_frame, "📁", "Total Files:", str(backup_data['total_files']), 1)
-                create_detail_row(content_frame, "📝", "Changed Files:", str(backup_data['changed_files']), 2)
-                create_detail_row(content_frame, "💾", "Total Size:", backup_data['total_size'], 3)
-                create_detail_row(content_frame, "🔄", "Backup Type:", backup_data['type'], 4)
-                create_detail_row(content_frame, "📂", "Backup Name:", backup_data.get('backup_name', 'N/A'), 5)
-
-                # Add backed up folders section
-                folders_frame = tk.Frame(content_frame, bg="white")
-                folders_frame.pack(fill="x", pady=10)
-
-                folders_label = tk.Label(folders_frame, text="Backed Up Folders:", 
-                                       font=("Helvetica", 10, "bold"), bg="white", fg="#7f8c8d")
-                folders_label.pack(anchor="w", pady=(0, 5))
-
-                # Create a frame for the folders list with scrollbar
-                folders_list_frame = tk.Frame(folders_frame, bg="white", relief="solid", bd=1)
-                folders_list_frame.pack(fill="both", expand=True)
-
-                folders_scrollbar = tk.Scrollbar(folders_list_frame)
-                folders_scrollbar.pack(side="right", fill="y")
-
-                folders_list = tk.Listbox(folders_list_frame, 
-                                        font=("Helvetica", 10),
-                                        bg="white",
-                                        fg="#2c3e50",
-                                        yscrollcommand=folders_scrollbar.set,
-                                        height=6)
-                folders_list.pack(side="left", fill="both", expand=True)
-                folders_scrollbar.config(command=folders_list.yview)
-
-                # Add folders to the list
-                for folder_name, original_path in backup_data['folders'].items():
-                    folders_list.insert(tk.END, f"{folder_name}: {original_path}")
-
-                # Add restore button
-                def on_restore():
-                    if messagebox.askyesno("Confirm Restore", 
-                                         "Are you sure you want to restore this backup?"):
-                        details_window.destroy()
-                        self.restore_backup()  # This will use the selected backup
-
-                restore_btn = ttk.Button(details_window, text="Restore This Backup", 
-                                       command=on_restore, style="Restore.TButton")
-                restore_btn.pack(pady=15)
-
-                # Close button
-                close_btn = ttk.Button(details_window, text="Close", 
-                                     command=details_window.destroy)
-                close_btn.pack(pady=(0, 15))
-
-                # Center the window
-                details_window.update_idletasks()
-                width = details_window.winfo_width()
-                height = details_window.winfo_height()
-                x = (details_window.winfo_screenwidth() // 2) - (width // 2)
-                y = (details_window.winfo_screenheight() // 2) - (height // 2)
-                details_window.geometry(f'{width}x{height}+{x}+{y}')
-                
-            except json.JSONDecodeError:
+            # Dict already parsed at load time; None marks an old-format line
+            backup_data = self._timeline_parsed[sel[0]]
+            if backup_data is None:
                 messagebox.showerror("Error", "Invalid backup entry format")
+                return
+            try:
+                self._ensure_details_window()
+
+                # Fill the cached value labels for this backup
+                display_time = _fmt_ts(backup_data['timestamp'])
+                detail_values = (
+                    display_time,
+                    str(backup_data['total_files']),
+                    str(backup_data['changed_files']),
+                    backup_data['total_size'],
+                    backup_data['type'],
+                    backup_data.get('backup_name', 'N/A'),
+                )
+                for value_label, value in zip(self._details_value_labels,
+                                              detail_values):
+                    value_label.config(text=value)
+
+                # Refill the folders text in one bulk insert
+                folders_text = self._details_folders_text
+                folders_text.config(state="normal")
+                folders_text.delete("1.0", tk.END)
+                folders_text.insert("1.0", "\n".join(
+                    f"{name}: {path}"
+                    for name, path in backup_data['folders'].items()))
+                folders_text.config(state="disabled")
+
+                self._details_window.deiconify()
+                self._details_window.grab_set()
+
             except Exception as e:
                 messagebox.showerror("Error", f"Error displaying backup details: {str(e)}")
 
+    def _ensure_details_window(self):
+        """Build the details window once; later opens only update text
+
+        Each open used to allocate a fresh Toplevel with ~30 children
+        and destroy it on close. The window is now constructed on the
+        first view and hidden on close, so subsequent clicks pay only
+        for label/Listbox updates.
+        """
+        if self._details_window is not None:
+            return
+
+        details_window = tk.Toplevel(self)
+        details_window.title("Backup Details")
+        details_window.geometry("600x500")
+        details_window.transient(self)
+        # Build the rows while unmapped; one geometry solve at the
+        # first deiconify
+        details_window.withdraw()
+        details_window.protocol("WM_DELETE_WINDOW", self._hide_details_window)
+        self._details_window = details_window
+
+        # Add details content
+        header_frame = tk.Frame(details_window, bg="white")
+        header_frame.pack(fill="x", pady=10, padx=15)
+
+        icon_label = tk.Label(header_frame, text="📋", font=("Helvetica", 16), bg="white")
+        icon_label.pack(side="left", padx=(0, 10))
+
+        title_label = tk.Label(header_frame, text="Backup Details",
+                             font=("Helvetica", 14, "bold"), bg="white", fg="#2c3e50")
+        title_label.pack(side="left")
+
+        # Details content
+        content_frame = tk.Frame(details_window, bg="white")
+        content_frame.pack(fill="both", expand=True, padx=15, pady=10)
+
+        # Static icons and captions; the value labels are cached and
+        # rewritten on every open
+        detail_rows = (
+            ("🕒", "Date:"),
+            ("📁", "Total Files:"),
+            ("📝", "Changed Files:"),
+            ("💾", "Total Size:"),
+            ("🔄", "Backup Type:"),
+            ("📂", "Backup Name:"),
+        )
+        # One gridded table instead of a packed Frame per row: three
+        # widgets per row land directly in the shared parent and Tk
+        # solves the whole table in one pass
+        details_table = tk.Frame(content_frame, bg="white")
+        details_table.pack(fill="x")
+        details_table.grid_columnconfigure(2, weight=1)
+        self._details_value_labels = [
+            self._create_detail_row(details_table, row, icon, label)
+            for row, (icon, label) in enumerate(detail_rows)
+        ]
+
+        # Add backed up folders section
+        folders_frame = tk.Frame(content_frame, bg="white")
+        folders_frame.pack(fill="x", pady=10)
+
+        folders_label = tk.Label(folders_frame, text="Backed Up Folders:",
+                               font=("Helvetica", 10, "bold"), bg="white", fg="#7f8c8d")
+        folders_label.pack(anchor="w", pady=(0, 5))
+
+        # Create a frame for the folders list with scrollbar
+        folders_list_frame = tk.Frame(folders_frame, bg="white", relief="solid", bd=1)
+        folders_list_frame.pack(fill="both", expand=True)
+
+        folders_scrollbar = tk.Scrollbar(folders_list_frame)
+        folders_scrollbar.pack(side="right", fill="y")
+
+        # A read-only Text instead of a Listbox: the folders are never
+        # selected individually, and one insert covers any folder count
+        self._details_folders_text = tk.Text(folders_list_frame,
+                                font=("Helvetica", 10),
+                                bg="white",
+                                fg="#2c3e50",
+                                yscrollcommand=folders_scrollbar.set,
+                                height=6,
+                                wrap="none",
+                                state="disabled")
+        self._details_folders_text.pack(side="left", fill="both", expand=True)
+        folders_scrollbar.config(command=self._details_folders_text.yview)
+
+        # Add restore button
+        restore_btn = ttk.Button(details_window, text="Restore This Backup",
+                               command=self._restore_from_details,
+                               **self._btn_kw['restore'])
+        restore_btn.pack(pady=15)
+
+        # Close button
+        close_btn = ttk.Button(details_window, text="Close",
+                             command=self._hide_details_window)
+        close_btn.pack(pady=(0, 15))
+
+        # Center the window once; position survives later opens
+        details_window.update_idletasks()
+        width = details_window.winfo_width()
+        height = details_window.winfo_height()
+        x = (self._screen_w // 2) - (width // 2)
+        y = (self._screen_h // 2) - (height // 2)
+        details_window.geometry(f'{width}x{height}+{x}+{y}')
+
+    def _hide_details_window(self):
+        """Hide the details dialog, keeping its widgets for the next open"""
+        self._details_window.grab_release()
+        self._details_window.withdraw()
+
+    def _restore_from_details(self):
+        """Confirm and restore the backup shown in the details dialog"""
+        if messagebox.askyesno("Confirm Restore",
+                             "Are you sure you want to restore this backup?"):
+            self._hide_details_window()
+            self.restore_backup()  # This will use the selected backup
+
+    def _create_detail_row(self, parent, row, icon, label):
+        """Grid one icon/label row into the details table
+
+        Returns the value Label so callers can rewrite its text on
+        each open.
+        """
+        icon_label = tk.Label(parent, text=icon, font=("Helvetica", 12), bg="white")
+        icon_label.grid(row=row, column=0, padx=(0, 8), pady=5, sticky="w")
+
+        label_text = tk.Label(parent, text=label, font=("Helvetica", 10, "bold"),
+                            bg="white", fg="#7f8c8d", width=15, anchor="w")
+        label_text.grid(row=row, column=1, padx=(0, 10), pady=5, sticky="w")
+
+        value_text = tk.Label(parent, text="", font=("Helvetica", 10),
+                            bg="white", fg="#2c3e50")
+        value_text.grid(row=row, column=2, pady=5, sticky="w")
+        return value_text
+
     def _restore_selected_backup(self):
         """Restore the selected backup"""
         sel = self.timeline_list.curselection()
@@ -1503,28 +1890,40 @@ class AutoStashGUI(tk.Tk):
                                  f"Are you sure you want to delete:\n{backup_entry}?"):
                 self.status_var.set(f"Deleting backup: {backup_entry}")
                 # Call your delete logic here
-                self.timeline_list.delete(sel)
-                self.load_backup_timeline()  # Refresh the list
+                # Drop the one row from the parallel caches and the list
+                # variable; nothing else changed on disk, so a full
+                # timeline reload would just re-insert every other row
+                idx = sel[0]
+                del self._timeline_raw[idx]
+                del self._timeline_parsed[idx]
+                del self._timeline_display[idx]
+                if idx < self._timeline_shown:
+                    self._timeline_shown -= 1
+                self._timeline_var.set(
+                    tuple(self._timeline_display[:self._timeline_shown]))
+                # The cached filter working set no longer matches
+                self._last_search = ""
+                self._last_filtered = []
 
     def _create_action_buttons(self):
         """Create action buttons for the main interface"""
-        action_frame = tk.Frame(self.main_container, bg=self.bg_color)
+        action_frame = tk.Frame(self.main_container, bg=self.palette.bg)
         action_frame.pack(fill="x", pady=10)
 
-        button_container = tk.Frame(action_frame, bg=self.white)
+        button_container = tk.Frame(action_frame, bg=self.palette.white)
         button_container.pack()
 
         # Use grid for better alignment
         run_btn = ttk.Button(button_container, text="Run Backup Now",
-                           command=self.run_backup, style="Run.TButton")
+                           command=self.run_backup, **self._btn_kw['run'])
         run_btn.grid(row=0, column=0, padx=5, pady=5)
 
         restore_btn = ttk.Button(button_container, text="Restore Backup",
-                               command=self.restore_backup, style="Restore.TButton")
+                               command=self.restore_backup, **self._btn_kw['restore'])
         restore_btn.grid(row=0, column=1, padx=5, pady=5)
 
         options_btn = ttk.Button(button_container, text="Advanced Options",
-                               command=self._show_advanced_options, style="Options.TButton")
+                               command=self._show_advanced_options, **self._btn_kw['options'])
         options_btn.grid(row=0, column=2, padx=5, pady=5)
 
     def _create_status_bar(self):
@@ -1544,7 +1943,9 @@ class AutoStashGUI(tk.Tk):
         options_window.geometry("600x500")
         options_window.resizable(False, False)
         options_window.transient(self)
-        options_window.grab_set()
+        # Keep the window unmapped while its widgets are packed so Tk
+        # solves the geometry once at deiconify instead of per widget
+        options_window.withdraw()
 
         # Main container with padding
         main_frame = tk.Frame(options_window, bg="white", padx=20, pady=20)
@@ -1573,75 +1974,12 @@ class AutoStashGUI(tk.Tk):
         config_section = ttk.LabelFrame(config_frame, text="Backup Configuration")
         config_section.pack(fill="x", padx=10, pady=5)
 
-        def export_config():
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".json",
-                filetypes=[("JSON files", "*.json")],
-                title="Export Configuration"
-            )
-            if file_path:
-                try:
-                    config_data = {
-                        "folders": self.folder_list.get(0, tk.END),
-                        "repository": self.repo_combobox.get(),
-                        "options": {
-                            "backup_system": self.system_files_var.get(),
-                            "encrypt": self.encrypt_var.get(),
-                            "compress": self.compression_var.get(),
-                            "incremental": self.incremental_var.get()
-                        },
-                        "schedule": {
-                            "frequency": self.schedule_combobox.get(),
-                            "hour": self.hour_var.get(),
-                            "minute": self.minute_var.get()
-                        }
-                    }
-                    with open(file_path, 'w') as f:
-                        json.dump(config_data, f, indent=4)
-                    messagebox.showinfo("Success", "Configuration exported successfully!")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to export configuration: {str(e)}")
-
-        def import_config():
-            file_path = filedialog.askopenfilename(
-                filetypes=[("JSON files", "*.json")],
-                title="Import Configuration"
-            )
-            if file_path:
-                try:
-                    with open(file_path, 'r') as f:
-                        config_data = json.load(f)
-                    
-                    # Update folders
-                    self.folder_list.delete(0, tk.END)
-                    for folder in config_data.get("folders", []):
-                        self.folder_list.insert(tk.END, folder)
-                    
-                    # Update repository
-                    if config_data.get("repository"):
-                        self.repo_combobox.set(config_data["repository"])
-                    
-                    # Update options
-                    options = config_data.get("options", {})
-                    self.system_files_var.set(options.get("backup_system", False))
-                    self.encrypt_var.set(options.get("encrypt", False))
-                    self.compression_var.set(options.get("compress", False))
-                    self.incremental_var.set(options.get("incremental", False))
-                    
-                    # Update schedule
-                    schedule = config_data.get("schedule", {})
-                    self.schedule_combobox.set(schedule.get("frequency", "Daily"))
-                    self.hour_var.set(schedule.get("hour", "02"))
-                    self.minute_var.set(schedule.get("minute", "00"))
-                    
-                    messagebox.showinfo("Success", "Configuration imported successfully!")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to import configuration: {str(e)}")
-
-        ttk.Button(config_section, text="Export Configuration", 
-                  command=export_config).pack(pady=5, anchor="w", padx=10)
-        ttk.Button(config_section, text="Import Configuration", 
-                  command=import_config).pack(pady=5, anchor="w", padx=10)
+        export_btn = ttk.Button(config_section, text="Export Configuration",
+                  command=self._export_config)
+        export_btn.pack(pady=5, anchor="w", padx=10)
+        import_btn = ttk.Button(config_section, text="Import Configuration",
+                  command=self._import_config)
+        import_btn.pack(pady=5, anchor="w", padx=10)
 
         # Maintenance Tab
         maintenance_frame = ttk.Frame(notebook)
@@ -1651,72 +1989,19 @@ class AutoStashGUI(tk.Tk):
         verify_section = ttk.LabelFrame(maintenance_frame, text="Backup Verification")
         verify_section.pack(fill="x", padx=10, pady=5)
 
-        def verify_backups():
-            try:
-                self.status_var.set("Verifying backups...")
-                result = self.backup.verify_backups()
-                if result["status"] == "success":
-                    messagebox.showinfo("Verification Complete", 
-                                      f"All backups verified successfully!\n\n"
-                                      f"Total backups checked: {result['total']}\n"
-                                      f"Verified: {result['verified']}\n"
-                                      f"Failed: {result['failed']}")
-                else:
-                    messagebox.showwarning("Verification Issues", 
-                                         f"Some backups failed verification:\n\n"
-                                         f"Total backups checked: {result['total']}\n"
-                                         f"Verified: {result['verified']}\n"
-                                         f"Failed: {result['failed']}\n\n"
-                                         f"Failed backups: {', '.join(result['failed_backups'])}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Verification failed: {str(e)}")
-            finally:
-                self.status_var.set("Ready")
-
-        def cleanup_old_backups():
-            try:
-                # Ask for retention period
-                retention = tk.simpledialog.askinteger(
-                    "Cleanup Old Backups",
-                    "Enter number of days to retain backups:",
-                    minvalue=1,
-                    maxvalue=365,
-                    initialvalue=30
-                )
-                if retention:
-                    self.status_var.set("Cleaning up old backups...")
-                    result = self.backup.cleanup_old_backups(retention)
-                    messagebox.showinfo("Cleanup Complete", 
-                                      f"Cleanup completed successfully!\n\n"
-                                      f"Backups removed: {result['removed']}\n"
-                                      f"Space freed: {result['space_freed']}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Cleanup failed: {str(e)}")
-            finally:
-                self.status_var.set("Ready")
-
-        def cleanup_all_backups():
-            if messagebox.askyesno("Confirm Cleanup", 
-                                 "Are you sure you want to delete ALL backups?\nThis action cannot be undone!"):
-                try:
-                    self.status_var.set("Cleaning up all backups...")
-                    result = self.backup.cleanup_all_backups()
-                    messagebox.showinfo("Cleanup Complete", 
-                                      f"All backups have been removed successfully!\n\n"
-                                      f"Space freed: {result['space_freed']} bytes")
-                    # Refresh the backup timeline
-                    self.load_backup_timeline()
-                except Exception as e:
-                    messagebox.showerror("Error", f"Cleanup failed: {str(e)}")
-                finally:
-                    self.status_var.set("Ready")
-
-        ttk.Button(verify_section, text="Verify All Backups", 
-                  command=verify_backups).pack(pady=5, anchor="w", padx=10)
-        ttk.Button(verify_section, text="Cleanup Old Backups", 
-                  command=cleanup_old_backups).pack(pady=5, anchor="w", padx=10)
-        ttk.Button(verify_section, text="Cleanup ALL Backups", 
-                  command=cleanup_all_backups).pack(pady=5, anchor="w", padx=10)
+        # The handlers live as methods; partial only binds the button
+        # (and parent window) they act on
+        verify_btn = ttk.Button(verify_section, text="Verify All Backups")
+        verify_btn.config(command=functools.partial(self._verify_backups, verify_btn))
+        verify_btn.pack(pady=5, anchor="w", padx=10)
+        cleanup_old_btn = ttk.Button(verify_section, text="Cleanup Old Backups")
+        cleanup_old_btn.config(command=functools.partial(
+            self._cleanup_old_backups, options_window, cleanup_old_btn))
+        cleanup_old_btn.pack(pady=5, anchor="w", padx=10)
+        cleanup_all_btn = ttk.Button(verify_section, text="Cleanup ALL Backups")
+        cleanup_all_btn.config(command=functools.partial(
+            self._cleanup_all_backups, cleanup_all_btn))
+        cleanup_all_btn.pack(pady=5, anchor="w", padx=10)
 
         # Security Tab
         security_frame = ttk.Frame(notebook)
@@ -1726,66 +2011,290 @@ class AutoStashGUI(tk.Tk):
         security_section = ttk.LabelFrame(security_frame, text="Encryption Settings")
         security_section.pack(fill="x", padx=10, pady=5)
 
-        def manage_gpg_keys():
-            key_window = tk.Toplevel(options_window)
-            key_window.title("GPG Key Management")
-            key_window.geometry("400x300")
-            key_window.transient(options_window)
-            key_window.grab_set()
-
-            # Add key management interface here
-            ttk.Label(key_window, text="GPG Key Management").pack(pady=10)
-            ttk.Button(key_window, text="Import Key").pack(pady=5)
-            ttk.Button(key_window, text="Export Key").pack(pady=5)
-            ttk.Button(key_window, text="Generate New Key").pack(pady=5)
-
-        ttk.Button(security_section, text="Manage GPG Keys", 
-                  command=manage_gpg_keys).pack(pady=5, anchor="w", padx=10)
+        ttk.Button(security_section, text="Manage GPG Keys",
+                  command=functools.partial(self._manage_gpg_keys,
+                                            options_window)).pack(
+            pady=5, anchor="w", padx=10)
 
         # Close button
         close_btn = ttk.Button(main_frame, text="Close", 
                              command=options_window.destroy)
         close_btn.pack(pady=(20, 0))
 
-        # Center the window
+        # Center the window, then map and grab it in one go
         options_window.update_idletasks()
         width = options_window.winfo_width()
         height = options_window.winfo_height()
-        x = (options_window.winfo_screenwidth() // 2) - (width // 2)
-        y = (options_window.winfo_screenheight() // 2) - (height // 2)
+        x = (self._screen_w // 2) - (width // 2)
+        y = (self._screen_h // 2) - (height // 2)
         options_window.geometry(f'{width}x{height}+{x}+{y}')
+        options_window.deiconify()
+        options_window.grab_set()
+
+    def _export_config(self):
+        """Export the current configuration to a JSON file"""
+        # asksaveasfile hands back the opened file object directly, so
+        # json.dump streams into it without a second open() round-trip
+        f = filedialog.asksaveasfile(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json")],
+            title="Export Configuration"
+        )
+        if f:
+            try:
+                config_data = {
+                    "folders": self._folders_order,
+                    "repository": self.repo_combobox.get(),
+                    "options": {
+                        "backup_system": self.system_files_var.get(),
+                        "encrypt": self.encrypt_var.get(),
+                        "compress": self.compression_var.get(),
+                        "incremental": self.incremental_var.get()
+                    },
+                    "schedule": {
+                        "frequency": self.schedule_combobox.get(),
+                        "hour": self.hour_var.get(),
+                        "minute": self.minute_var.get()
+                    }
+                }
+                with f:
+                    json.dump(config_data, f, indent=2, separators=(',', ': '))
+                messagebox.showinfo("Success", "Configuration exported successfully!")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to export configuration: {str(e)}")
+
+    def _import_config(self):
+        """Import configuration from a JSON file and apply it"""
+        f = filedialog.askopenfile(
+            filetypes=[("JSON files", "*.json")],
+            title="Import Configuration"
+        )
+        if f:
+            try:
+                with f:
+                    config_data = json.load(f)
+
+                # Update folders (and their in-memory mirror)
+                folders = config_data.get("folders", [])
+                self._folders_order = list(folders)
+                self._folders = set(folders)
+                self.folder_list.delete(0, tk.END)
+                if folders:
+                    # Single variadic insert: one Tcl call for any count
+                    self.folder_list.insert(tk.END, *folders)
+
+                # Update repository
+                if config_data.get("repository"):
+                    self.repo_combobox.set(config_data["repository"])
+
+                # Update options
+                options = config_data.get("options", {})
+                self.system_files_var.set(options.get("backup_system", False))
+                self.encrypt_var.set(options.get("encrypt", False))
+                self.compression_var.set(options.get("compress", False))
+                self.incremental_var.set(options.get("incremental", False))
+
+                # Update schedule
+                schedule = config_data.get("schedule", {})
+                self.schedule_combobox.set(schedule.get("frequency", "Daily"))
+                self.hour_var.set(schedule.get("hour", "02"))
+                self.minute_var.set(schedule.get("minute", "00"))
+
+                messagebox.showinfo("Success", "Configuration imported successfully!")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to import configuration: {str(e)}")
+
+    def _verify_backups(self, btn):
+        """Verify all backups on a worker thread
+
+        The button stays disabled until the result dialog is posted
+        back through after(0, ...) so the event loop keeps painting.
+        """
+        btn.state(["disabled"])
+        self.status_var.set("Verifying backups...")
+
+        def verify_worker():
+            try:
+                result = self.backup.verify_backups()
+                self.after(0, self._on_verify_done, btn, result, None)
+            except Exception as e:
+                self.after(0, self._on_verify_done, btn, None, str(e))
+
+        threading.Thread(target=verify_worker, daemon=True).start()
+
+    def _on_verify_done(self, btn, result, error):
+        """Report the verification outcome on the Tk thread"""
+        btn.state(["!disabled"])
+        self.status_var.set("Ready")
+        if error is not None:
+            messagebox.showerror("Error", f"Verification failed: {error}")
+        elif result["status"] == "success":
+            messagebox.showinfo("Verification Complete",
+                              f"All backups verified successfully!\n\n"
+                              f"Total backups checked: {result['total']}\n"
+                              f"Verified: {result['verified']}\n"
+                              f"Failed: {result['failed']}")
+        else:
+            messagebox.showwarning("Verification Issues",
+                                 f"Some backups failed verification:\n\n"
+                                 f"Total backups checked: {result['total']}\n"
+                                 f"Verified: {result['verified']}\n"
+                                 f"Failed: {result['failed']}\n\n"
+                                 f"Failed backups: {', '.join(result['failed_backups'])}")
+
+    def _cleanup_old_backups(self, parent, btn):
+        """Prompt for a retention period and clean up older backups
+
+        A small inline prompt instead of askinteger: the stock dialog
+        runs a nested event loop that freezes redraws for as long as
+        it is open.
+        """
+        prompt = tk.Toplevel(parent)
+        prompt.title("Cleanup Old Backups")
+        prompt.transient(parent)
+        prompt.resizable(False, False)
+        # Modal like the askinteger it replaced; a grab doesn't run a
+        # nested event loop, so redraws keep flowing
+        prompt.grab_set()
+
+        ttk.Label(prompt,
+                  text="Enter number of days to retain backups:").pack(
+            padx=15, pady=(15, 5))
+        retention_var = tk.StringVar(value="30")
+        entry = ttk.Entry(prompt, textvariable=retention_var, width=10)
+        entry.pack(pady=5)
+        entry.focus_set()
+
+        def on_ok():
+            try:
+                retention = int(retention_var.get())
+                if not 1 <= retention <= 365:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror(
+                    "Error", "Please enter a number between 1 and 365.",
+                    parent=prompt)
+                return
+            prompt.destroy()
+            self._start_cleanup_old(btn, retention)
+
+        button_row = ttk.Frame(prompt)
+        button_row.pack(pady=(5, 15))
+        ttk.Button(button_row, text="OK", command=on_ok).pack(
+            side="left", padx=5)
+        ttk.Button(button_row, text="Cancel",
+                   command=prompt.destroy).pack(side="left", padx=5)
+        entry.bind("<Return>", lambda _e: on_ok())
+
+    def _start_cleanup_old(self, btn, retention):
+        """Run cleanup_old_backups on a worker thread"""
+        btn.state(["disabled"])
+        self.status_var.set("Cleaning up old backups...")
+
+        def cleanup_worker():
+            try:
+                result = self.backup.cleanup_old_backups(retention)
+                self.after(0, self._on_cleanup_old_done, btn, result, None)
+            except Exception as e:
+                self.after(0, self._on_cleanup_old_done, btn, None, str(e))
+
+        threading.Thread(target=cleanup_worker, daemon=True).start()
+
+    def _on_cleanup_old_done(self, btn, result, error):
+        """Report the cleanup outcome on the Tk thread"""
+        btn.state(["!disabled"])
+        self.status_var.set("Ready")
+        if error is not None:
+            messagebox.showerror("Error", f"Cleanup failed: {error}")
+        else:
+            messagebox.showinfo("Cleanup Complete",
+                              f"Cleanup completed successfully!\n\n"
+                              f"Backups removed: {result['removed']}\n"
+                              f"Space freed: {result['space_freed']}")
+
+    def _cleanup_all_backups(self, btn):
+        """Delete all backups on a worker thread after confirmation"""
+        if messagebox.askyesno("Confirm Cleanup",
+                             "Are you sure you want to delete ALL backups?\nThis action cannot be undone!"):
+            btn.state(["disabled"])
+            self.status_var.set("Cleaning up all backups...")
+
+            def cleanup_all_worker():
+                try:
+                    result = self.backup.cleanup_all_backups()
+                    self.after(0, self._on_cleanup_all_done, btn, result, None)
+                except Exception as e:
+                    self.after(0, self._on_cleanup_all_done, btn, None, str(e))
+
+            threading.Thread(target=cleanup_all_worker, daemon=True).start()
+
+    def _on_cleanup_all_done(self, btn, result, error):
+        """Report the full-cleanup outcome on the Tk thread"""
+        btn.state(["!disabled"])
+        self.status_var.set("Ready")
+        if error is not None:
+            messagebox.showerror("Error", f"Cleanup failed: {error}")
+        else:
+            messagebox.showinfo("Cleanup Complete",
+                              f"All backups have been removed successfully!\n\n"
+                              f"Space freed: {result['space_freed']} bytes")
+            # Refresh the backup timeline
+            self.load_backup_timeline()
+
+    def _manage_gpg_keys(self, parent):
+        """Show the GPG key management window"""
+        key_window = tk.Toplevel(parent)
+        key_window.title("GPG Key Management")
+        key_window.geometry("400x300")
+        key_window.transient(parent)
+        key_window.grab_set()
+
+        # Add key management interface here
+        ttk.Label(key_window, text="GPG Key Management").pack(pady=10)
+        ttk.Button(key_window, text="Import Key").pack(pady=5)
+        ttk.Button(key_window, text="Export Key").pack(pady=5)
+        ttk.Button(key_window, text="Generate New Key").pack(pady=5)
 
     def check_backup_status(self):
         """Check and update the backup status"""
         last_backup = self.backup.get_last_backup_time()
         if last_backup:
             try:
-                backup_time = datetime.datetime.strptime(last_backup, "%Y-%m-%d %H:%M:%S")
-                now = datetime.datetime.now()
-                self.last_backup_label.config(
-                    text=f"Last backup: {backup_time.strftime('%Y-%m-%d %H:%M')}", 
-                    fg="#c0392b"
-                )
-                if (now - backup_time).total_seconds() > 24 * 60 * 60:
-                    self.last_backup_label.config(fg="#c0392b")
-                    try:
-                        days = (now - backup_time).days
-                        subprocess.run([
-                            "notify-send",
-                            "AutoStash Backup Overdue",
-                            f"Last backup was {days} days ago"
-                        ])
-                    except:
-                        pass
+                # Re-parse only when the stored timestamp string changed
+                if last_backup != self._last_backup_str:
+                    self._last_backup_dt = datetime.datetime.strptime(
+                        last_backup, "%Y-%m-%d %H:%M:%S")
+                    self._last_backup_str = last_backup
+                    self.last_backup_label.config(
+                        text=f"Last backup: {self._last_backup_dt.strftime('%Y-%m-%d %H:%M')}"
+                    )
+                # One clock read and one timedelta for the whole check
+                age = datetime.datetime.now() - self._last_backup_dt
+                if age.total_seconds() > 24 * 60 * 60:
+                    self._set_label_fg(self.last_backup_label, "#c0392b")
+                    # Notify once per distinct backup timestamp, without
+                    # blocking on the notification daemon
+                    if self._overdue_notified_for != last_backup:
+                        self._overdue_notified_for = last_backup
+                        try:
+                            days = age.days
+                            subprocess.Popen([
+                                "notify-send",
+                                "AutoStash Backup Overdue",
+                                f"Last backup was {days} days ago"
+                            ], close_fds=True)
+                        except:
+                            pass
                 else:
-                    self.last_backup_label.config(fg="#27ae60")
+                    self._set_label_fg(self.last_backup_label, "#27ae60")
             except Exception as e:
                 self.last_backup_label.config(
-                    text=f"Error reading backup time: {str(e)}", 
-                    fg="#c0392b"
+                    text=f"Error reading backup time: {str(e)}"
                 )
+                self._set_label_fg(self.last_backup_label, "#c0392b")
         else:
-            self.last_backup_label.config(text="No previous backups found", fg="#c0392b")
+            self.last_backup_label.config(text="No previous backups found")
+            self._set_label_fg(self.last_backup_label, "#c0392b")
         self.after(3600000, self.check_backup_status)
 
     def show_error(self, message, title="Error"):
@@ -1832,19 +2341,23 @@ class AutoStashGUI(tk.Tk):
         # Update status
         self.status_label.config(text="Starting backup...")
         self.progress_var.set(0)
-        self.root.update()
+        self.update_idletasks()
+
+        # Worker-to-UI handoff: progress goes through a queue drained on
+        # the Tk thread, so the worker never touches widgets directly
+        self._ui_queue = queue.Queue()
+        self._backup_thread_running = True
+        self.after(50, self._drain_ui_queue)
 
         # Start backup in a separate thread
         def backup_thread():
             try:
                 # Initialize backup manager
                 backup_manager = BackupManager()
-                
+
                 # Create progress callback
                 def update_progress(progress, status):
-                    self.progress_var.set(progress)
-                    self.status_label.config(text=status)
-                    self.root.update()
+                    self._ui_queue.put((progress, status, None))
 
                 # Start backup with progress updates
                 result = backup_manager.run(
@@ -1857,21 +2370,51 @@ class AutoStashGUI(tk.Tk):
                     progress_callback=update_progress
                 )
 
-                # Update final status
+                # Queue final status
                 if result['status'] == 'success':
-                    self.status_label.config(text=f"Backup completed successfully!")
-                    # Update backup info
-                    self.update_backup_info(result)
+                    self._ui_queue.put(
+                        (100, "Backup completed successfully!", result))
                 else:
-                    self.status_label.config(text=f"Backup failed: {result.get('error', 'Unknown error')}")
+                    self._ui_queue.put(
+                        (None,
+                         f"Backup failed: {result.get('error', 'Unknown error')}",
+                         None))
 
             except Exception as e:
-                self.status_label.config(text=f"Backup failed: {str(e)}")
-                messagebox.showerror("Backup Error", str(e))
+                self._ui_queue.put((None, f"Backup failed: {str(e)}", None))
+            finally:
+                self._backup_thread_running = False
 
         # Start backup thread
         threading.Thread(target=backup_thread, daemon=True).start()
 
+    def _drain_ui_queue(self):
+        """Apply queued backup-progress updates on the Tk thread
+
+        Drains everything pending in one pass and applies only the newest
+        (progress, status, result) tuple, so bursts of worker updates
+        coalesce into one widget write plus one update_idletasks.
+        """
+        latest = None
+        while True:
+            try:
+                latest = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+
+        if latest is not None:
+            progress, status, result = latest
+            if progress is not None:
+                self.progress_var.set(progress)
+            if status:
+                self.status_label.config(text=status)
+            if result is not None:
+                self.update_backup_info(result)
+            self.update_idletasks()
+
+        if self._backup_thread_running or latest is not None:
+            self.after(50, self._drain_ui_queue)
+
     def update_backup_info(self, result):
         """Update backup information display with dynamic data"""
         try:
@@ -1895,12 +2438,10 @@ class AutoStashGUI(tk.Tk):
             # Update status
             self.status_label.config(text="Backup completed successfully!")
             
-            # Update progress
+            # Update progress; the drain loop flushes idle tasks once
+            # after applying the whole batch
             self.progress_var.set(100)
-            
-            # Force GUI update
-            self.root.update()
-            
+
         except Exception as e:
             self.logger.error(f"Error updating backup info: {str(e)}")
 
@@ -1,136 +1,222 @@
+import types
+import weakref
+from dataclasses import dataclass
+
 import tkinter as tk
 from tkinter import ttk
 
+# Theme colors, shared by the style tables below and by the Palette
+WHITE = "#ffffff"
+PRIMARY = "#1e3799"    # Dark blue
+SECONDARY = "#4a69bd"  # Medium blue
+ACCENT = "#38ada9"     # Teal
+BLACK = "#2c3e50"      # Dark gray
+BG = "#f5f6fa"         # Light gray
+TEXT = "#2f3640"       # Dark gray
+SUCCESS = "#44bd32"    # Green
+WARNING = "#e1b12c"    # Yellow
+ERROR = "#c23616"      # Red
+
+
+@dataclass(frozen=True)
+class Palette:
+    """The theme colors, attached to the app as one shared attribute"""
+    white: str = WHITE
+    primary: str = PRIMARY
+    secondary: str = SECONDARY
+    accent: str = ACCENT
+    black: str = BLACK
+    bg: str = BG
+    text: str = TEXT
+    success: str = SUCCESS
+    warning: str = WARNING
+    error: str = ERROR
+
+
+_PALETTE = Palette()
+
+# Interned literals repeated across the tables, so every occurrence
+# marshals the same str object to Tcl
+_WHITE = "white"
+_TROUGH = "#e0e0e0"
+_ACTIVE_GREEN = "#28a745"
+
+# Named fonts shared across the tables. The names are registered with
+# Tk once per root in setup_styles, so style lookups resolve the font
+# by hash instead of re-parsing a tuple spec on every draw.
+_FONT_9 = "ASH_Regular9"
+_FONT_10 = "ASH_Regular10"
+_FONT_10_BOLD = "ASH_Bold10"
+_FONT_12_BOLD = "ASH_Bold12"
+
+_NAMED_FONTS = (
+    (_FONT_9, {"family": "Helvetica", "size": 9}),
+    (_FONT_10, {"family": "Helvetica", "size": 10}),
+    (_FONT_10_BOLD, {"family": "Helvetica", "size": 10, "weight": "bold"}),
+    (_FONT_12_BOLD, {"family": "Helvetica", "size": 12, "weight": "bold"}),
+)
+
+# Shared option payloads for the button families; each variant only
+# adds its background color, so the common fragment exists once
+_TOOL_BTN = {"font": _FONT_10_BOLD, "foreground": _WHITE,
+             "padding": (10, 6), "borderwidth": 0}
+_ACTION_BTN = {"font": _FONT_10_BOLD, "foreground": _WHITE,
+               "padding": (12, 6), "relief": "flat"}
+_GITHUB_BTN = {"font": _FONT_9, "foreground": _WHITE, "padding": (10, 4)}
+
+# All named styles as data: (style name, {option: value}). Merged into
+# one theme settings dict at import so setup_styles crosses the
+# Python/Tcl boundary once instead of per configure call.
+_STYLES = (
+    # Frame styles
+    ("Card.TFrame", {"background": BG, "borderwidth": 1, "relief": "solid"}),
+
+    # LabelFrame styles
+    ("Card.TLabelframe", {"background": _WHITE, "borderwidth": 1,
+                          "relief": "solid", "padding": 10}),
+    ("Card.TLabelframe.Label", {"font": _FONT_12_BOLD,
+                                "background": _WHITE, "foreground": PRIMARY}),
+
+    # Label styles
+    ("TLabel", {"background": _WHITE, "foreground": TEXT}),
+
+    # Button styles
+    ("TButton", {"font": _FONT_10, "padding": 8}),
+
+    # Checkbutton styles
+    ("TCheckbutton", {"background": _WHITE}),
+
+    # Combobox styles
+    ("TCombobox", {"fieldbackground": _WHITE, "padding": 5}),
+
+    # Progress bar styles
+    ("TProgressbar", {"thickness": 18, "troughcolor": _TROUGH,
+                      "background": ACCENT, "bordercolor": "#bdc3c7",
+                      "lightcolor": ACCENT, "darkcolor": PRIMARY}),
+
+    # Browse Button Style (Primary Action)
+    ("Browse.TButton", {**_TOOL_BTN, "background": PRIMARY}),
+
+    # Remove Button Style (Destructive Action)
+    ("Remove.TButton", {**_TOOL_BTN, "background": ERROR}),
+
+    # "Run Backup Now" button
+    ("Run.TButton", {**_ACTION_BTN, "background": SUCCESS}),
+
+    # "Restore Backup" button
+    ("Restore.TButton", {**_ACTION_BTN, "background": SECONDARY}),
+
+    # "Advanced Options" button
+    ("Options.TButton", {**_ACTION_BTN, "background": "#7f8c8d"}),
+
+    # GitHub button style; the connected/error variants are deferred
+    ("GitHub.TButton", {**_GITHUB_BTN, "background": "#24292e"}),
+)
+
+# Styles only needed by lazily built tabs or rare state changes; these
+# stay out of the theme and are registered on first use by
+# ensure_style, trimming the Tcl work before first paint
+_DEFERRED_STYLES = types.MappingProxyType({
+    # CPU, Memory, and Disk progress bars (monitor tab). The colors
+    # match the inline configure block this table replaced, which used
+    # to win by running last.
+    "CPU.Horizontal.TProgressbar": {"background": "#3498db",
+                                    "troughcolor": "#f0f0f0"},
+    "MEM.Horizontal.TProgressbar": {"background": "#2ecc71",
+                                    "troughcolor": "#f0f0f0"},
+    "DISK.Horizontal.TProgressbar": {"background": "#e74c3c",
+                                     "troughcolor": "#f0f0f0"},
+
+    # GitHub connected/error states
+    "Connected.TButton": {**_GITHUB_BTN, "background": _ACTIVE_GREEN},
+    "Error.TButton": {**_GITHUB_BTN, "background": "#dc3545"},
+})
+
+# Dynamic state maps: (style name, {option: ((state, value), ...)})
+_MAPS = (
+    ("Browse.TButton", {"background": (("active", "#163d7a"),),
+                        "foreground": (("active", _WHITE),)}),
+    ("Remove.TButton", {"background": (("active", "#a93226"),),
+                        "foreground": (("active", _WHITE),)}),
+    ("Run.TButton", {"background": (("active", _ACTIVE_GREEN),),
+                     "foreground": (("active", _WHITE),)}),
+    ("Restore.TButton", {"background": (("active", PRIMARY),),
+                         "foreground": (("active", _WHITE),)}),
+    ("Options.TButton", {"background": (("active", "#95a5a6"),),
+                         "foreground": (("active", _WHITE),)}),
+)
+
+
+def _build_settings():
+    """Merge the style tables into one frozen theme settings mapping
+
+    The read-only proxies make the table safely shareable across app
+    windows and guarantee it is assembled exactly once at import.
+    """
+    settings = {}
+    for name, opts in _STYLES:
+        settings.setdefault(name, {})["configure"] = opts
+    for name, opts in _MAPS:
+        settings.setdefault(name, {})["map"] = {
+            opt: list(pairs) for opt, pairs in opts.items()}
+    return types.MappingProxyType(
+        {name: types.MappingProxyType(spec)
+         for name, spec in settings.items()})
+
+
+_THEME_SETTINGS = _build_settings()
+
+# Pre-rendered Tcl settings script: the Python-to-Tcl conversion of
+# every option happens once at import, so theme creation just hands
+# the interpreter a ready-made string
+_THEME_SCRIPT = ttk._script_from_settings(_THEME_SETTINGS)
+
+# Apps whose named styles are already configured; a WeakSet so closed
+# roots do not keep their flag alive
+_configured = weakref.WeakSet()
+
+# Deferred style names that have already been registered
+_registered = set()
+
+
+def ensure_style(app, name):
+        """Register a deferred style the first time a widget needs it"""
+        if name not in _registered:
+            _registered.add(name)
+            ttk.Style(app).configure(name, **_DEFERRED_STYLES[name])
+
 
 def setup_styles(app):
-        """Configure the styles for the application"""
+        """Configure the styles for the application
+
+        The overrides register as a dedicated clam-derived theme, so
+        Tk compiles the whole settings dict in one shot instead of
+        mutating the live theme configure call by configure call.
+        The colors land on the app as one shared frozen Palette
+        instead of ten separate attribute writes.
+        """
         style = ttk.Style(app)
-        style.theme_use("clam")
-
-        # Set app theme colors
-        app.white = "#ffffff" 
-        app.primary_color = "#1e3799"  # Dark blue
-        app.secondary_color = "#4a69bd"  # Medium blue
-        app.accent_color = "#38ada9"  # Teal
-        app.black = "#2c3e50"  # Dark gray
-        app.bg_color = "#f5f6fa"  # Light gray
-        app.text_color = "#2f3640"  # Dark gray
-        app.success_color = "#44bd32"  # Green
-        app.warning_color = "#e1b12c"  # Yellow
-        app.error_color = "#c23616"  # Red
-    
-        # Frame styles
-        style.configure("Card.TFrame", background=app.bg_color, borderwidth=1, relief="solid")
-    
-        # LabelFrame styles
-        style.configure("Card.TLabelframe", background="white", borderwidth=1, 
-                        relief="solid", padding=10)
-        style.configure("Card.TLabelframe.Label", font=("Helvetica", 12, "bold"), 
-                    background="white", foreground=app.primary_color)
-    
-    # Label styles
-        style.configure("TLabel", background="white", foreground=app.text_color)
-        style.configure("Header.TLabel", font=("Helvetica", 14, "bold"), 
-                        background=app.bg_color, foreground=app.primary_color)
-        style.configure("Status.TLabel", font=("Helvetica", 10), 
-                    background="white", padding=5)
-    
-        # Button styles
-        style.configure("TButton", font=("Helvetica", 10), padding=8)
-        style.configure("Primary.TButton", background=app.primary_color, 
-                        foreground="white", borderwidth=0)
-        style.map("Primary.TButton", 
-                  background=[("active", app.secondary_color), ("disabled", "#cccccc")])
-    
-        # Checkbutton styles
-        style.configure("TCheckbutton", background="white")
-    
-        # Combobox styles
-        style.configure("TCombobox", fieldbackground="white", padding=5)
-    
-        # Progress bar styles
-        style.configure("TProgressbar", thickness=18, troughcolor="#e0e0e0", 
-                        background=app.accent_color, bordercolor="#bdc3c7", 
-                        lightcolor=app.accent_color, darkcolor=app.primary_color)
-    
-        # Configure CPU, Memory, and Disk progress bars
-        style.configure("CPU.Horizontal.TProgressbar", background="#3498db", troughcolor="#e0e0e0")
-        style.configure("MEM.Horizontal.TProgressbar", background="#9b59b6", troughcolor="#e0e0e0")
-        style.configure("DISK.Horizontal.TProgressbar", background="#2ecc71", troughcolor="#e0e0e0")
-
-        # Browse Button Style (Primary Action)
-        style.configure("Browse.TButton",
-                        font=("Helvetica", 10, "bold"),
-                        foreground="white",
-                        background=app.primary_color,
-                        padding=(10, 6),
-                        borderwidth=0)
-        style.map("Browse.TButton",
-                  background=[("active", "#163d7a")],
-                  foreground=[("active", "white")])
-
-        # Remove Button Style (Destructive Action)
-        style.configure("Remove.TButton",
-                        font=("Helvetica", 10, "bold"),
-                        foreground="white",
-                        background=app.error_color,
-                        padding=(10, 6),
-                        borderwidth=0)
-        style.map("Remove.TButton",
-                  background=[("active", "#a93226")],
-                  foreground=[("active", "white")])
-
-        # === Style for "Run Backup Now" button ===
-        style.configure("Run.TButton",
-                        font=("Helvetica", 10, "bold"),
-                        foreground="white",
-                        background=app.success_color,  # Green (success)
-                        padding=(12, 6),
-                        relief="flat")
-        style.map("Run.TButton",
-                  background=[("active", "#28a745")],  # Active state green
-                  foreground=[("active", "white")])
-        
-        # === Style for "Restore Backup" button ===
-        style.configure("Restore.TButton",
-                        font=("Helvetica", 10, "bold"),
-                        foreground="white",
-                        background=app.secondary_color,  # Blue (restore)
-                        padding=(12, 6),
-                        relief="flat")
-        style.map("Restore.TButton",
-                  background=[("active", app.primary_color)],  # Active state blue
-                  foreground=[("active", "white")])
-        
-        # === Style for "Advanced Options" button ===
-        style.configure("Options.TButton",
-                        font=("Helvetica", 10, "bold"),
-                        foreground="white",
-                        background="#7f8c8d",  # Neutral gray (options)
-                        padding=(12, 6),
-                        relief="flat")
-        style.map("Options.TButton",
-                  background=[("active", "#95a5a6")],  # Active state light gray
-                  foreground=[("active", "white")])
-
-        # === GitHub Button Styles ===
-        # Default GitHub button style
-        style.configure("GitHub.TButton",
-                        font=("Helvetica", 9),
-                        background="#24292e",
-                        foreground="white",
-                        padding=(10, 4))
-        
-        # Connected state style
-        style.configure("Connected.TButton",
-                        font=("Helvetica", 9),
-                        background="#28a745",
-                        foreground="white",
-                        padding=(10, 4))
-        
-        # Error state style
-        style.configure("Error.TButton",
-                        font=("Helvetica", 9),
-                        background="#dc3545",
-                        foreground="white",
-                        padding=(10, 4))
+        app.palette = _PALETTE
+        if app in _configured:
+            return style
+        for name, opts in _NAMED_FONTS:
+            try:
+                # font create directly: a tkinter.font.Font wrapper
+                # would delete the named font again when the Python
+                # object is garbage collected
+                args = []
+                for opt, val in opts.items():
+                    args += ("-" + opt, val)
+                app.tk.call("font", "create", name, *args)
+            except tk.TclError:
+                # Named font already registered in this interpreter
+                pass
+        try:
+            app.tk.call("ttk::style", "theme", "create", "autostash",
+                        "-parent", "clam", "-settings", _THEME_SCRIPT)
+        except tk.TclError:
+            # Already registered in this interpreter
+            pass
+        style.theme_use("autostash")
+        _configured.add(app)
+        return style